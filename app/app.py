@@ -1,3 +1,4 @@
+import importlib
 import tkinter as tk
 from tkinter import ttk
 
@@ -7,10 +8,25 @@ try:
 except:
     HAVE_SV = False
 
-from ui.login import LoginFrame
-from ui.home import HomeFrame
-from ui.pages.account_book import AccountBookPage
-from ui.pages.analytics_page import AnalyticsPage
+from app.tasks import TaskRunner
+from services.auth import AuthService
+
+# 페이지 이름 -> (모듈, 클래스)
+# - 모듈은 처음 show() 할 때 import (pandas/matplotlib 은 로그인 화면 뒤에 필요)
+# - 로그인 화면이 뜬 뒤 작업 스레드에서 미리 import 해 둠 (_warm_up)
+PAGES = {
+    "login": ("ui.login", "LoginFrame"),
+    "home": ("ui.home", "HomeFrame"),
+    "account": ("ui.pages.account_book", "AccountBookPage"),
+    "analytics": ("ui.pages.analytics_page", "AnalyticsPage"),
+}
+
+
+def _import_pages():
+    for module, _ in PAGES.values():
+        importlib.import_module(module)
+
+
 """프로그램 메인 창 """
 class App(tk.Tk):
     def __init__(self):
@@ -39,29 +55,47 @@ class App(tk.Tk):
         except Exception:
             pass
 
+        # 페이지 데이터 읽기/집계는 작업 스레드에서 (mainloop 가 멈추지 않게)
+        self.tasks = TaskRunner(self)
+
         container = ttk.Frame(self)
         container.pack(fill="both", expand=True)
         container.grid_rowconfigure(0, weight=1)
         container.grid_columnconfigure(0, weight=1)
 
-        self.frames = {}
-        def add(frame_cls, name):
-            frame = frame_cls(container, self)
-            self.frames[name] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
+        self._container = container
+        self.frames = {}  # 이미 만든 페이지만 (나머지는 처음 show 할 때 생성)
 
-        add(LoginFrame, "login")
-        add(HomeFrame, "home")
-        add(AccountBookPage, "account")
-        add(AnalyticsPage, "analytics")
+        # 이전 users.json -> 사용자별 파일 (로그인 화면보다 먼저, import 때가 아니라 실행할 때)
+        # main.py 와 python -m app.app 두 실행 경로가 모두 여기를 지남
+        AuthService().migrate_json()
 
         self.show("login")
+        self.after_idle(self._warm_up)
+
+    def page(self, name: str):
+        """페이지 프레임 반환 (아직 없으면 이때 import/생성)"""
+        f = self.frames.get(name)
+        if f is None:
+            module, cls = PAGES[name]
+            frame_cls = getattr(importlib.import_module(module), cls)
+            f = self.frames[name] = frame_cls(self._container, self)
+            f.grid(row=0, column=0, sticky="nsew")
+        return f
+
+    def _warm_up(self):
+        # 사용자가 로그인 정보를 입력하는 동안 무거운 모듈을 미리 import (위젯 생성은 메인 스레드에서)
+        self.tasks.submit(_import_pages, key="warm-up", on_error=lambda e: None)
 
     def show(self, name: str):
-        f = self.frames[name]
+        f = self.page(name)
         if hasattr(f, "on_show"):
             f.on_show()
         f.tkraise()
 
+    def destroy(self):
+        self.tasks.shutdown()
+        super().destroy()
+
 if __name__ == "__main__":
     App().mainloop()
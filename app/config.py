@@ -12,6 +12,25 @@ USERS_CSV = DATA_DIR / "users.csv"
 DATE_FMT = "%Y-%m-%d"
 CSV_PATH = DATA_DIR / "transactions.csv"  # (레거시용, 안 씀) 사용자별로 분기 저장
 
+# 거래 저장소
+# - "csv": 사용자별 transactions_<user>.csv 한 파일
+# - "partitioned": 월별 파일 LEDGER_DIR/<user>/YYYY-MM.csv
+# - "sqlite": LEDGER_DB 한 파일
+STORAGE_BACKEND = "csv"
+LEDGER_DIR = DATA_DIR / "ledger"
+LEDGER_DB = DATA_DIR / "ledger.sqlite3"
+
+# 월별 집계(월 x 카테고리 x 구분 -> 합계/건수) 저장 위치
+AGGREGATE_DIR = DATA_DIR / "aggregates"
+
+# 비밀번호 해시 (services.auth)
+# - PASSWORD_SCHEME: 새로 만드는 해시 방식 ("scrypt" 또는 "pbkdf2_sha256")
+# - PASSWORD_COST: 방식별 비용 (scrypt N, pbkdf2 반복 횟수)
+#   이 PC에 맞는 값 찾기: python -m services.auth calibrate [목표ms]
+# - 방식/비용이 이와 다른 해시(이전 SHA-256 포함)는 로그인 성공 때 새 설정으로 다시 저장
+PASSWORD_SCHEME = "scrypt"
+PASSWORD_COST = {"scrypt": 2 ** 14, "pbkdf2_sha256": 600_000}
+
 # 색상(심플 톤)
 COLOR_BG = "#f7f7fa"
 COLOR_PANEL = "#f0f2f5"
@@ -21,6 +40,9 @@ COLOR_INC = "#059669"      # 초록
 COLOR_EXP = "#dc2626"      # 빨강
 COLOR_STRIPE = "#fafbff"
 
+# 거래 구분
+TYPES = ["수입", "지출"]
+
 # 카테고리
 CATEGORIES = [
     "식비", "교통", "주거/관리", "통신", "여가/문화", "의료/건강",
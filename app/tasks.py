@@ -0,0 +1,93 @@
+"""백그라운드 작업 실행기: 무거운 읽기/집계는 작업 스레드에서, 결과 반영은 Tk 메인 스레드에서"""
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class TaskRunner:
+    """
+    - submit(fn, *args, key=..., on_done=..., on_error=...) 로 작업 스레드에서 fn 실행
+    - 끝나면 on_done(result) / on_error(exc) 를 after() 로 메인 스레드에서 호출
+    - 같은 key 로 다시 submit 하면 이전 작업 결과는 버림 (페이지/사용자가 바뀐 뒤 도착한 결과 무시)
+    - 작업 스레드에서는 Tk 위젯을 건드리지 말 것
+    """
+
+    POLL_MS = 30
+
+    def __init__(self, root, workers: int = 2) -> None:
+        self.root = root
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="task")
+        self._done: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation: Dict[str, int] = {}
+        self._pending = 0
+        self._polling = False
+
+    def submit(self, fn: Callable[..., Any], *args, key: Optional[str] = None,
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None) -> Future:
+        with self._lock:
+            gen = self._generation.get(key, 0) + 1 if key is not None else 0
+            if key is not None:
+                self._generation[key] = gen
+            self._pending += 1
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self._done.put(lambda: self._finish(f, key, gen, on_done, on_error)))
+        self._schedule_poll()
+        return future
+
+    def post(self, fn: Callable[..., None], *args):
+        """
+        작업 스레드에서 메인 스레드로 콜백 전달 (진행률 표시 등)
+        - 진행 중인 작업이 있는 동안만 쓸 것 (그때만 큐를 비움)
+        """
+        self._done.put(lambda: fn(*args))
+
+    def cancel(self, key: str):
+        """key 로 진행 중인 작업의 결과를 버림"""
+        with self._lock:
+            self._generation[key] = self._generation.get(key, 0) + 1
+
+    def is_current(self, key: str, gen: int) -> bool:
+        with self._lock:
+            return self._generation.get(key, 0) == gen
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ---------- 메인 스레드 ----------
+    def _schedule_poll(self):
+        # submit 은 메인 스레드에서만 호출되므로 after 예약도 메인 스레드에서 일어남
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_MS, self._poll)
+
+    def _poll(self):
+        self._polling = False
+        while True:
+            try:
+                finish = self._done.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                finish()
+            except Exception as exc:  # 콜백 하나가 실패해도 나머지 결과는 계속 전달
+                self.root.report_callback_exception(type(exc), exc, exc.__traceback__)
+        if self._pending:
+            self._schedule_poll()
+
+    def _finish(self, future: Future, key, gen, on_done, on_error):
+        with self._lock:
+            self._pending -= 1
+        if future.cancelled() or (key is not None and not self.is_current(key, gen)):
+            return
+        exc = future.exception()
+        if exc is not None:
+            if on_error is not None:
+                on_error(exc)
+            else:
+                self.root.report_callback_exception(type(exc), exc, exc.__traceback__)
+            return
+        if on_done is not None:
+            on_done(future.result())
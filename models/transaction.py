@@ -1,6 +1,119 @@
-from dataclasses import dataclass
-from datetime import datetime
-from app.config import DATE_FMT
+import threading
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.config import DATE_FMT, TYPES
+
+# 거래 id: 생성 시각(ns) 기반 정수, 같은 프로세스 안에서는 항상 증가
+_id_lock = threading.Lock()
+_last_id = 0
+
+def new_ids(n: int) -> List[int]:
+    """새 거래 id n개 (연속된 정수)"""
+    global _last_id
+    with _id_lock:
+        start = max(time.time_ns(), _last_id + 1)
+        _last_id = start + n - 1
+    return list(range(start, start + n))
+
+def new_id() -> int:
+    return new_ids(1)[0]
+
+# ---------- 검증 규칙 (한 건 validate 와 묶음 validate_batch 가 함께 씀) ----------
+# 오류 코드는 비트 합: 한 행에 여러 문제가 있으면 모두 표시됨
+ERR_DATE = 1    # 날짜가 DATE_FMT 형식이 아님
+ERR_TYPE = 2    # 구분이 TYPES 에 없음
+ERR_AMOUNT = 4  # 금액이 정수가 아니거나 int64 범위 밖
+ERROR_LABELS = {ERR_DATE: "날짜", ERR_TYPE: "구분", ERR_AMOUNT: "금액"}
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """날짜 열 -> datetime64 (형식이 틀리면 NaT). 앞뒤 공백 허용"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    dates = pd.to_datetime(values, format=DATE_FMT, errors="coerce")
+    retry = dates.isna() & values.notna()
+    if retry.any():  # 실패한 행만 공백을 지우고 다시 (보통 몇 행 안 됨)
+        dates[retry] = pd.to_datetime(values[retry].astype(str).str.strip(), format=DATE_FMT, errors="coerce")
+    return dates
+
+_AMOUNT_BLOCK = 65_536  # 정수 변환을 이 행 수씩 시도 (잘못된 값이 있는 묶음만 느린 경로)
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+def _exact_int(text: str):
+    """
+    문자열 -> int (정수가 아니거나 int64 범위 밖이면 None)
+    - float 를 거치지 않음: 큰 수도 자릿수 그대로 ('100.0', '1e3' 처럼 정수인 소수/지수 표기는 허용)
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        try:
+            number = Decimal(text)
+            if not number.is_finite() or number != number.to_integral_value():
+                return None
+            value = int(number)
+        except ArithmeticError:
+            return None
+    return value if _INT64_MIN <= value <= _INT64_MAX else None
+
+def _parse_amounts(values: pd.Series) -> pd.Series:
+    """금액 열 -> 정수 (정수가 아니거나 int64 범위 밖이면 NA). 문자열은 쉼표/공백 허용"""
+    if pd.api.types.is_integer_dtype(values):
+        return values
+    if pd.api.types.is_float_dtype(values):
+        return values.where((values % 1 == 0) & (values.abs() < 2.0 ** 63))
+    parts = []
+    for start in range(0, len(values), _AMOUNT_BLOCK):
+        block = values.iloc[start:start + _AMOUNT_BLOCK]
+        # 빠른 경로는 문자열/정수 묶음만: object 열의 1.5 같은 소수는 astype 이 조용히 잘라 버림
+        if pd.api.types.infer_dtype(block, skipna=False) in ("string", "integer"):
+            try:
+                parts.append(block.astype("int64"))  # 대부분 깔끔한 정수 문자열: 빠른 경로
+                continue
+            except (ValueError, TypeError, OverflowError):
+                pass
+        text = block.astype(str).str.replace(",", "").str.strip()
+        try:
+            parts.append(text.astype("int64"))  # 천 단위 쉼표만 있던 경우
+        except (ValueError, TypeError, OverflowError):
+            # 잘못된 값이 있는 묶음: 한 값씩 정확히 변환 (nullable Int64 라 큰 정수도 손실 없음)
+            parts.append(pd.Series([_exact_int(t) for t in text], index=block.index, dtype="Int64"))
+    if not parts:
+        return values.astype("int64")
+    return parts[0] if len(parts) == 1 else pd.concat(parts)
+
+def check_batch(date, type_, amount) -> Tuple[pd.Series, pd.Series, np.ndarray]:
+    """
+    열 단위 검사 (행 루프 없음).
+    반환: (날짜 datetime64, 금액, 행별 오류 코드 uint8) — 변환 결과도 돌려줘 다시 파싱하지 않게 함
+    """
+    date, type_, amount = (v if isinstance(v, pd.Series) else pd.Series(v) for v in (date, type_, amount))
+    dates = _parse_dates(date)
+    amounts = _parse_amounts(amount)
+    codes = np.zeros(len(dates), dtype=np.uint8)
+    codes[dates.isna().to_numpy()] |= ERR_DATE
+    codes[~type_.isin(TYPES).to_numpy()] |= ERR_TYPE
+    codes[amounts.isna().to_numpy()] |= ERR_AMOUNT
+    return dates, amounts, codes
+
+def validate_batch(data) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 거래를 한 번에 검사 (가져오기/복구/이전용).
+    - data: DataFrame 또는 {"date": ..., "type": ..., "amount": ...} 열 묶음
+    - 반환: (통과 여부 bool 배열, 행별 오류 코드 uint8 배열)
+    """
+    _, _, codes = check_batch(data["date"], data["type"], data["amount"])
+    return codes == 0, codes
+
+def error_labels(code: int) -> List[str]:
+    """오류 코드 -> ['날짜', '금액'] 처럼 문제 항목 이름 목록"""
+    return [label for bit, label in ERROR_LABELS.items() if code & bit]
+
 # 한 건의 거래(수입/지출)를 표현하는 데이터 모델과 검증 로직
 @dataclass
 class Transaction:
@@ -11,24 +124,28 @@ class Transaction:
     - category: 카테고리명
     - description: 설명
     - amount: 금액(정수, 원화)
+    - id: 거래 고유 번호 (저장 후 바뀌지 않음, 삭제 등에 사용)
     """
     date: str
     type: str
     category: str
     description: str
     amount: int
+    id: int = field(default_factory=new_id)
 
     @staticmethod
     def validate(tx: "Transaction"):
         """
-        입력값 간단 검증:
-        - 날짜 형식이 맞는지
+        입력값 간단 검증 (규칙은 validate_batch 와 같음, 틀리면 ValueError):
+        - 날짜 형식이 맞는지 (한 건 입력은 앞뒤 공백 불허, 파일 읽기만 허용)
         - type이 '수입'/'지출' 중 하나인지
-        - 금액이 정수인지
+        - 금액이 정수인지 (한 건 입력은 int 값이어야 함)
         """
-        # 날짜 형식 검증 (형식이 틀리면 ValueError 발생)
-        datetime.strptime(tx.date, DATE_FMT)
-        if tx.type not in ("수입", "지출"):
+        _, ok_codes = validate_batch({"date": [tx.date], "type": [tx.type], "amount": [tx.amount]})
+        code = int(ok_codes[0])
+        if code & ERR_DATE or not isinstance(tx.date, str) or tx.date != tx.date.strip():
+            raise ValueError(f"날짜는 {DATE_FMT} 형식이어야 합니다: {tx.date!r}")
+        if code & ERR_TYPE:
             raise ValueError("type은 '수입' 또는 '지출'이어야 합니다.")
-        if not isinstance(tx.amount, int):
+        if code & ERR_AMOUNT or not isinstance(tx.amount, int):
             raise ValueError("amount는 정수여야 합니다.")
@@ -0,0 +1,285 @@
+"""
+거래 원장을 열(column) 배열로 담는 메모리 저장소
+- 한 거래 = id(int64) + 날짜(int32, 1970-01-01 부터의 일수) + 구분(int8) + 카테고리 번호(int16)
+  + 설명 번호(int32) + 금액(int64) + 잔액(int64) = 35바이트, 설명/카테고리 문자열은 한 번씩만 보관
+- 행은 항상 날짜순 (같은 날짜는 넣은 순서), 날짜 범위는 이진 탐색으로 찾음
+- 잔액 = 첫 거래부터 그 행까지 순증감 누적합, 추가/삭제 때는 바뀐 위치 뒤쪽만 고침
+- 한 행은 TransactionRow(__slots__ 뷰)로 읽음 (값을 복사해 두지 않음)
+"""
+import sys
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from app.config import CATEGORIES, DATE_FMT, TYPES
+from models.transaction import Transaction
+
+INCOME = TYPES.index("수입")  # 구분 번호 = TYPES 안의 위치
+_EPOCH = date(1970, 1, 1).toordinal()
+
+# 열 이름 -> 자료형
+_COLUMNS = (
+    ("id", np.int64),
+    ("day", np.int32),
+    ("type", np.int8),
+    ("category", np.int16),
+    ("description", np.int32),
+    ("amount", np.int64),
+    ("balance", np.int64),  # 그 행까지의 누적 잔액
+)
+
+
+def day_number(value) -> int:
+    """'YYYY-MM-DD' / date / datetime64 -> 1970-01-01 부터의 일수"""
+    if isinstance(value, str):
+        value = datetime.strptime(value.strip(), DATE_FMT)
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.toordinal() - _EPOCH
+    return int(np.datetime64(value, "D").astype(np.int64))
+
+
+def day_text(day: int) -> str:
+    """일수 -> 'YYYY-MM-DD'"""
+    return date.fromordinal(int(day) + _EPOCH).strftime(DATE_FMT)
+
+
+class StringTable:
+    """같은 문자열은 한 번만 보관하는 표 (문자열 <-> 번호)"""
+    __slots__ = ("values", "_index")
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[str] = list(values)
+        self._index: Dict[str, int] = {v: i for i, v in enumerate(self.values)}
+
+    def __len__(self):
+        return len(self.values)
+
+    def code(self, value: str) -> int:
+        """value 의 번호 (처음 보는 값이면 추가)"""
+        i = self._index.get(value)
+        if i is None:
+            i = self._index[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+    def codes(self, values: pd.Series) -> np.ndarray:
+        """여러 값의 번호 (겹치지 않는 값만 사전 조회, Categorical 이면 기존 코드 재사용)"""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            local, uniques = values.cat.codes.to_numpy(), values.cat.categories.astype(str)
+        else:
+            local, uniques = pd.factorize(values.astype(str))
+        remap = np.array([self.code(v) for v in uniques], dtype=np.int64)
+        return remap[local] if len(local) else np.empty(0, dtype=np.int64)
+
+    def nbytes(self) -> int:
+        return sum(sys.getsizeof(v) for v in self.values)
+
+
+class TransactionRow:
+    """
+    저장소의 i번째 행을 읽는 가벼운 뷰 (__slots__, 값 복사 없음)
+    - 저장소에 추가/삭제가 일어나면 위치가 바뀌므로 다시 얻어 쓸 것
+    """
+    __slots__ = ("_store", "_i")
+
+    def __init__(self, store: "TransactionStore", i: int):
+        self._store = store
+        self._i = i
+
+    def _get(self, name: str):
+        return self._store._cols[name][self._i]
+
+    @property
+    def id(self) -> int:
+        return int(self._get("id"))
+
+    @property
+    def day(self) -> int:
+        return int(self._get("day"))
+
+    @property
+    def date(self) -> str:
+        return day_text(self._get("day"))
+
+    @property
+    def type(self) -> str:
+        return TYPES[self._get("type")]
+
+    @property
+    def category(self) -> str:
+        return self._store.categories.values[self._get("category")]
+
+    @property
+    def description(self) -> str:
+        return self._store.descriptions.values[self._get("description")]
+
+    @property
+    def amount(self) -> int:
+        return int(self._get("amount"))
+
+    @property
+    def balance(self) -> int:
+        """이 거래까지 반영한 잔액"""
+        return int(self._get("balance"))
+
+    def to_transaction(self) -> Transaction:
+        return Transaction(date=self.date, type=self.type, category=self.category,
+                           description=self.description, amount=self.amount, id=self.id)
+
+    def __repr__(self):
+        return f"TransactionRow({self.date}, {self.type}, {self.category}, {self.amount:,}, id={self.id})"
+
+
+class TransactionStore:
+    """
+    날짜순 열 배열 원장
+    - from_frame / to_frame: storage 의 타입 지정 DataFrame 과 서로 변환
+    - append(tx): 날짜 위치에 끼워 넣기 (배열은 여유 공간을 두고 늘림)
+    - delete(ids): 지운 행들을 새 저장소로 돌려줌 (합계 조정용)
+    - store[i] -> TransactionRow, store[a:b] / between(start, end) -> 같은 문자열 표를 쓰는 부분 저장소 (행 배열은 복사)
+    """
+
+    def __init__(self, capacity: int = 0, categories: StringTable = None, descriptions: StringTable = None):
+        self._n = 0
+        self._cols: Dict[str, np.ndarray] = {name: np.empty(capacity, dtype) for name, dtype in _COLUMNS}
+        self.categories = categories if categories is not None else StringTable(CATEGORIES)
+        self.descriptions = descriptions if descriptions is not None else StringTable([""])
+
+    # ---------- 변환 ----------
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "TransactionStore":
+        """storage.read_all 형식(id/date/type/category/description/amount) -> 저장소 (날짜순 정렬)"""
+        store = cls(capacity=len(df))
+        if df.empty:
+            return store
+        # 코드 배열을 먼저 만들고 정수 배열만 날짜순으로 재배열 (문자열 열은 옮기지 않음)
+        dates = df["date"].to_numpy()
+        order = np.argsort(dates, kind="stable")
+        cols = store._cols
+        cols["id"][:] = df["id"].to_numpy()[order]
+        cols["day"][:] = dates.astype("datetime64[D]").astype(np.int64)[order]
+        cols["type"][:] = pd.Categorical(df["type"].astype(str), categories=TYPES).codes[order]
+        cols["category"][:] = store.categories.codes(df["category"])[order]
+        cols["description"][:] = store.descriptions.codes(df["description"])[order]
+        cols["amount"][:] = df["amount"].to_numpy()[order]
+        store._n = len(df)
+        np.cumsum(store.signed_amounts(), out=cols["balance"])
+        return store
+
+    def to_frame(self) -> pd.DataFrame:
+        """storage 와 같은 타입 지정 DataFrame (날짜순)"""
+        return pd.DataFrame({
+            "id": self.column("id").copy(),
+            "date": self.column("day").astype("datetime64[D]").astype("datetime64[ns]"),
+            "type": pd.Categorical.from_codes(self.column("type"), categories=TYPES),
+            "category": pd.Categorical.from_codes(self.column("category"), categories=self.categories.values),
+            "description": np.array(self.descriptions.values, dtype=object)[self.column("description")],
+            "amount": self.column("amount").copy(),
+        })
+
+    # ---------- 읽기 ----------
+    def __len__(self):
+        return self._n
+
+    def column(self, name: str) -> np.ndarray:
+        """열 배열 (복사 없는 뷰, 수정하지 말 것)"""
+        return self._cols[name][:self._n]
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            part = TransactionStore(0, self.categories, self.descriptions)
+            part._cols = {name: self.column(name)[key].copy() for name in self._cols}
+            part._n = len(part._cols["id"])
+            return part
+        i = key + self._n if key < 0 else key
+        if not 0 <= i < self._n:
+            raise IndexError(key)
+        return TransactionRow(self, i)
+
+    def date_range(self, start, end) -> slice:
+        """start~end(포함) 날짜의 행 위치 범위 (이진 탐색)"""
+        days = self.column("day")
+        lo = int(np.searchsorted(days, day_number(start), side="left"))
+        hi = int(np.searchsorted(days, day_number(end), side="right"))
+        return slice(lo, max(lo, hi))
+
+    def between(self, start, end) -> "TransactionStore":
+        return self[self.date_range(start, end)]
+
+    def signed_amounts(self) -> np.ndarray:
+        """수입은 +, 지출은 - 금액"""
+        amt = self.column("amount")
+        return np.where(self.column("type") == INCOME, amt, -amt)
+
+    def balance_on(self, day) -> int:
+        """day 날짜가 끝났을 때의 잔액 (그 전 거래가 없으면 0)"""
+        i = int(np.searchsorted(self.column("day"), day_number(day), side="right"))
+        return int(self._cols["balance"][i - 1]) if i else 0
+
+    def totals(self) -> Tuple[int, int]:
+        """(수입 합계, 지출 합계)"""
+        is_inc = self.column("type") == INCOME
+        amt = self.column("amount")
+        return int(amt[is_inc].sum()), int(amt[~is_inc].sum())
+
+    def nbytes(self) -> int:
+        """사용 중인 행 배열 + 문자열 표 크기 (바이트)"""
+        rows = sum(self.column(name).nbytes for name in self._cols)
+        return rows + self.categories.nbytes() + self.descriptions.nbytes()
+
+    # ---------- 변경 ----------
+    def append(self, tx: Union[Transaction, dict]) -> int:
+        """같은 날짜의 맨 뒤에 넣고 그 위치 반환"""
+        values = tx if isinstance(tx, dict) else tx.__dict__
+        row = {
+            "id": values["id"],
+            "day": day_number(values["date"]),
+            "type": TYPES.index(values["type"]),
+            "category": self.categories.code(values["category"]),
+            "description": self.descriptions.code(values["description"]),
+            "amount": values["amount"],
+        }
+        signed = row["amount"] if row["type"] == INCOME else -row["amount"]
+        pos = int(np.searchsorted(self.column("day"), row["day"], side="right"))
+        self._reserve(self._n + 1)
+        n = self._n
+        row["balance"] = (self._cols["balance"][pos - 1] if pos else 0) + signed
+        for name, col in self._cols.items():
+            col[pos + 1:n + 1] = col[pos:n]  # 뒤쪽만 한 칸 밀기 (겹치는 복사도 numpy 가 처리)
+            col[pos] = row[name]
+        self._cols["balance"][pos + 1:n + 1] += signed  # 뒤쪽 잔액만 이동
+        self._n += 1
+        return pos
+
+    def delete(self, ids: Iterable[int]) -> "TransactionStore":
+        """id 목록의 행을 빼고, 빠진 행들을 새 저장소로 반환"""
+        hit = np.isin(self.column("id"), np.fromiter(ids, dtype=np.int64))
+        removed = TransactionStore(0, self.categories, self.descriptions)
+        removed._cols = {name: self.column(name)[hit] for name in self._cols}
+        removed._n = int(hit.sum())
+        if removed._n:
+            # 첫 삭제 위치 앞쪽은 그대로 두고 뒤쪽만 당기며, 잔액은 그때까지 지운 금액만큼 뺌
+            first = int(np.argmax(hit))
+            n, k = self._n, self._n - removed._n
+            gone = np.cumsum(np.where(hit[first:], self.signed_amounts()[first:], 0))
+            self._cols["balance"][first:n] -= gone
+            keep = ~hit[first:]
+            for name, col in self._cols.items():
+                col[first:k] = col[first:n][keep]
+            self._n = k
+        return removed
+
+    def _reserve(self, size: int):
+        """배열 여유 공간 확보 (1.5배씩 늘려 추가가 평균 O(1) 복사)"""
+        capacity = len(self._cols["id"])
+        if size <= capacity:
+            return
+        capacity = max(size, capacity + capacity // 2, 16)
+        for name, col in self._cols.items():
+            grown = np.empty(capacity, col.dtype)
+            grown[:self._n] = col[:self._n]
+            self._cols[name] = grown
@@ -0,0 +1,203 @@
+# services/aggregates.py
+"""
+월별 집계 저장소: (사용자, 월, 카테고리, 구분) -> 합계/건수
+- AGGREGATE_DIR/<user>.csv 에 보관, 거래 추가/삭제 때 변경분만 더하고 뺌
+- 파일 첫 줄에 만들 때의 원장 스탬프(ledger_stamp)를 기록, 원장 스탬프와 다르거나 파일이 없으면
+  조회할 때 원장(거래 전체)에서 다시 만듦 (CSV 직접 수정, 쓰기 도중 종료, 백업 복원 등)
+- 다시 만들기/일치 확인: python -m services.aggregates (rebuild|check) <username> [...]
+"""
+from __future__ import annotations
+
+import csv
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from app.config import AGGREGATE_DIR
+from services import storage
+
+TOTAL_COLUMNS = ["month", "category", "type", "sum", "count"]
+
+_LEDGER_PREFIX = "#ledger="
+
+# username -> {month: {(category, type): [sum, count]}}
+_Totals = Dict[str, Dict[Tuple[str, str], List[int]]]
+# username -> (집계 파일 스탬프, 원장 스탬프 repr, 집계)
+_stores: Dict[str, Tuple[Tuple[int, int], Optional[str], _Totals]] = {}
+
+
+def _path(username: str):
+    return AGGREGATE_DIR / f"{username}.csv"
+
+
+def _ledger(username: str) -> str:
+    """현재 원장 스탬프 (파일에 적는 문자열 형태)"""
+    return repr(storage.get_backend().ledger_stamp(username))
+
+
+def compute(df: pd.DataFrame) -> _Totals:
+    """거래 DataFrame(read_all 형식) -> 월별 집계"""
+    out: _Totals = {}
+    if df.empty:
+        return out
+    months = df["date"].dt.strftime("%Y-%m")
+    grouped = df.groupby([months, df["category"], df["type"]], observed=True)["amount"].agg(["sum", "count"])
+    for (month, category, type_), (total, count) in grouped.iterrows():
+        out.setdefault(month, {})[(str(category), str(type_))] = [int(total), int(count)]
+    return out
+
+
+def _merge(totals: _Totals, delta: _Totals, sign: int):
+    for month, cells in delta.items():
+        dst = totals.setdefault(month, {})
+        for key, (total, count) in cells.items():
+            cell = dst.setdefault(key, [0, 0])
+            cell[0] += sign * total
+            cell[1] += sign * count
+            if cell[1] <= 0:
+                del dst[key]
+        if not dst:
+            del totals[month]
+
+
+# ---------- 파일 입출력 ----------
+def _load(username: str) -> Optional[Tuple[_Totals, Optional[str]]]:
+    """
+    저장된 (집계, 만들 때의 원장 스탬프). 파일이 없으면 None
+    - 파일이 바뀌지 않았으면 메모리 값 사용
+    - 스탬프 줄이 없는 이전 형식 파일은 스탬프 None (다음 조회 때 다시 만듦)
+    """
+    path = _path(username)
+    if not path.exists():
+        _stores.pop(username, None)
+        return None
+    stamp = storage._stamp(path)
+    hit = _stores.get(username)
+    if hit is not None and hit[0] == stamp:
+        return hit[2], hit[1]
+    totals: _Totals = {}
+    with open(path, encoding="utf-8", newline="") as f:
+        first = f.readline().rstrip("\r\n")
+        ledger = first[len(_LEDGER_PREFIX):] if first.startswith(_LEDGER_PREFIX) else None
+        if ledger is None:
+            f.seek(0)
+        for rec in csv.DictReader(f):
+            totals.setdefault(rec["month"], {})[(rec["category"], rec["type"])] = [
+                int(rec["sum"]), int(rec["count"])]
+    _stores[username] = (stamp, ledger, totals)
+    return totals, ledger
+
+
+def _save(username: str, totals: _Totals, ledger: str):
+    """임시 파일에 쓴 뒤 교체 (중간에 끊겨도 이전 파일은 온전)"""
+    path = _path(username)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        f.write(_LEDGER_PREFIX + ledger + "\n")
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(TOTAL_COLUMNS)
+        for month in sorted(totals):
+            for (category, type_), (total, count) in sorted(totals[month].items()):
+                w.writerow([month, category, type_, total, count])
+    os.replace(tmp, path)
+    _stores[username] = (storage._stamp(path), ledger, totals)
+
+
+def _drop(username: str):
+    _stores.pop(username, None)
+    try:
+        _path(username).unlink()
+    except FileNotFoundError:
+        pass
+
+
+# ---------- Public API ----------
+def on_write(username: str, added: Optional[pd.DataFrame] = None,
+             removed: Optional[pd.DataFrame] = None, before=None):
+    """
+    storage 쓰기 후 호출됨.
+    - added/removed 만큼 더하고 뺌
+    - 둘 다 None(전체 교체)이거나 집계가 쓰기 직전 원장(before)과 이미 어긋나 있었으면
+      집계를 버리고 다음 조회 때 다시 만듦
+    """
+    with storage.io_lock:
+        if added is None and removed is None:
+            _drop(username)
+            return
+        loaded = _load(username)
+        if loaded is None:
+            return  # 아직 없음: 다음 조회 때 원장에서 만들면 이번 변경도 포함됨
+        totals, ledger = loaded
+        if ledger != repr(before):
+            _drop(username)
+            return
+        if added is not None:
+            _merge(totals, compute(added), +1)
+        if removed is not None:
+            _merge(totals, compute(removed), -1)
+        _save(username, totals, _ledger(username))
+
+
+def rebuild(username: str) -> _Totals:
+    """원장 전체에서 다시 계산해 저장"""
+    with storage.io_lock:
+        # 스탬프를 먼저 읽음: 읽는 도중 원장이 바뀌면 다음 조회 때 스탬프가 달라 다시 만듦
+        ledger = _ledger(username)
+        totals = compute(storage.get_backend().read_all(username))
+        _save(username, totals, ledger)
+        return totals
+
+
+def month_totals(username: str, year_month: str) -> pd.DataFrame:
+    """
+    한 달의 (category, type, sum, count) 표 — 최대 카테고리 수 x 2 행
+    """
+    with storage.io_lock:  # 작업 스레드에서도 조회함 (storage 와 같은 잠금)
+        loaded = _load(username)
+        if loaded is None or loaded[1] != _ledger(username):
+            totals = rebuild(username)
+        else:
+            totals = loaded[0]
+        cells = dict(totals.get(year_month, {}))
+    return pd.DataFrame(
+        [(c, t, s, n) for (c, t), (s, n) in cells.items()],
+        columns=["category", "type", "sum", "count"],
+    )
+
+
+def check(username: str) -> List[str]:
+    """저장된 집계와 원장 재계산 결과 비교, 다른 칸을 설명하는 문자열 목록"""
+    stored = (_load(username) or ({}, None))[0]
+    actual = compute(storage.get_backend().read_all(username))
+    problems = []
+    for month in sorted(set(stored) | set(actual)):
+        s, a = stored.get(month, {}), actual.get(month, {})
+        for key in sorted(set(s) | set(a)):
+            if s.get(key) != a.get(key):
+                problems.append(f"{month} {key[0]}/{key[1]}: 저장 {s.get(key)} != 원장 {a.get(key)}")
+    return problems
+
+
+def _main(argv: List[str]) -> int:
+    if len(argv) < 2 or argv[0] not in ("rebuild", "check"):
+        print("사용법: python -m services.aggregates (rebuild|check) <username> [...]")
+        return 2
+    status = 0
+    for username in argv[1:]:
+        if argv[0] == "rebuild":
+            totals = rebuild(username)
+            print(f"{username}: {len(totals)}개월 집계 다시 만듦")
+        else:
+            problems = check(username)
+            print(f"{username}: " + ("일치" if not problems else f"{len(problems)}건 불일치"))
+            for p in problems:
+                print("  " + p)
+            status = status or (1 if problems else 0)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
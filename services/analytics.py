@@ -1,5 +1,85 @@
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Dict
+
+import numpy as np
 import pandas as pd
+
+from models.transaction_store import INCOME
+from services import aggregates, range_index, storage
+
+# ---------- 결과 캐시 ----------
+# 사용자별 조회 결과: (사용자, 조회 이름, 인자, 원장 스탬프) -> 결과 (LRU, 최대 MEMO_MAX 개)
+# - 같은 달 요약을 홈/가계부/분석 화면이 각각 다시 계산하지 않도록
+# - 원장 스탬프(ledger_stamp)는 앱 밖에서 원장을 고쳐도 바뀌므로 이전 결과는 쓰이지 않음
+# - storage 가 그 사용자 원장에 쓰면 on_write 에서 그 사용자 결과를 바로 버림
+# - 돌려준 DataFrame/Series 는 여러 곳이 함께 쓰므로 수정 금지
+MEMO_MAX = 256
+_memo: "OrderedDict[tuple, object]" = OrderedDict()
+_memo_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+def _memoized(fn):
+    """username 을 첫 인자로 받는 조회 결과를 캐시 (기본값/키워드 인자는 위치 인자로 맞춰 같은 키로)"""
+    sig = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def wrapper(username: str, *args, **kwargs):
+        bound = sig.bind(username, *args, **kwargs)
+        bound.apply_defaults()
+        key = (username, fn.__name__, bound.args[1:], storage.get_backend().ledger_stamp(username))
+        with _memo_lock:
+            if key in _memo:
+                _memo.move_to_end(key)
+                _stats["hits"] += 1
+                return _memo[key]
+            _stats["misses"] += 1
+        value = fn(*bound.args)  # 계산은 잠금 밖에서 (오래 걸릴 수 있음)
+        with _memo_lock:
+            _memo[key] = value
+            _memo.move_to_end(key)
+            while len(_memo) > MEMO_MAX:
+                _memo.popitem(last=False)
+        return value
+    return wrapper
+
+def on_write(username: str):
+    """storage 쓰기 후 호출됨: 그 사용자의 캐시된 결과 제거"""
+    with _memo_lock:
+        for key in [k for k in _memo if k[0] == username]:
+            del _memo[key]
+
+def cache_info() -> Dict[str, int]:
+    """캐시 적중/실패 횟수와 현재 항목 수 (운영 중 효과 확인용)"""
+    with _memo_lock:
+        return dict(_stats, size=len(_memo), max=MEMO_MAX)
+
+def cache_clear():
+    with _memo_lock:
+        _memo.clear()
+        _stats.update(hits=0, misses=0)
+
 # 분석용 집계 함수: 월별 카테고리 합계/일자별 순증감 시리즈 생성
+def signed_amount(df: pd.DataFrame) -> pd.Series:
+    """
+    수입은 +, 지출은 - 로 부호를 붙인 금액 시리즈 (행 단위 파이썬 루프 없이 벡터 연산)
+    """
+    sign = np.where(df["type"] == "수입", 1, -1)
+    return df["amount"] * sign
+
+def _month_rows(df: pd.DataFrame, year_month: str) -> pd.DataFrame:
+    """
+    date(datetime64) 컬럼에서 'YYYY-MM' 달에 해당하는 행만 반환.
+    - 형식이 잘못된 월이면 빈 DataFrame
+    """
+    try:
+        start, end = storage.month_bounds(year_month)
+    except (ValueError, TypeError):
+        return df.iloc[0:0]
+    return df[(df["date"] >= start) & (df["date"] <= end)]
+
 def month_summary(df: pd.DataFrame, year_month: str) -> pd.DataFrame:
     """
     year_month: 'YYYY-MM' 문자열 (예: '2025-08')
@@ -10,32 +90,85 @@ def month_summary(df: pd.DataFrame, year_month: str) -> pd.DataFrame:
         return pd.DataFrame(columns=["category", "수입", "지출", "순합"])
 
     # 지정 월만 필터
-    dff = df[df["date"].str.startswith(year_month)].copy()
+    dff = _month_rows(df, year_month)
     if dff.empty:
         return pd.DataFrame(columns=["category", "수입", "지출", "순합"])
 
-    # 수입/지출 각각 카테고리별 합계
-    inc = dff[dff["type"] == "수입"].groupby("category")["amount"].sum().rename("수입")
-    exp = dff[dff["type"] == "지출"].groupby("category")["amount"].sum().rename("지출")
+    # 수입/지출 각각 카테고리별 합계 (실제 등장한 카테고리만)
+    inc = dff[dff["type"] == "수입"].groupby("category", observed=True)["amount"].sum()
+    exp = dff[dff["type"] == "지출"].groupby("category", observed=True)["amount"].sum()
+    return _summary_table(inc, exp)
 
+@_memoized
+def user_month_summary(username: str, year_month: str) -> pd.DataFrame:
+    """
+    month_summary 와 같은 표를 월별 집계 저장소에서 바로 만듦 (원장을 읽지 않음)
+    """
+    totals = aggregates.month_totals(username, year_month)
+    if totals.empty:
+        return pd.DataFrame(columns=["category", "수입", "지출", "순합"])
+    inc = totals[totals["type"] == "수입"].set_index("category")["sum"]
+    exp = totals[totals["type"] == "지출"].set_index("category")["sum"]
+    return _summary_table(inc, exp)
+
+def _summary_table(inc: pd.Series, exp: pd.Series) -> pd.DataFrame:
+    """카테고리별 수입/지출 합계 시리즈 -> category/수입/지출/순합 표 (순합 내림차순)"""
     # 두 시리즈를 합치고 NaN을 0으로 채움
-    out = pd.concat([inc, exp], axis=1).fillna(0).astype(int)
+    out = pd.concat([inc.rename("수입"), exp.rename("지출")], axis=1).fillna(0).astype(int)
+    out.index = out.index.astype(str)
+    out.index.name = "category"
     out["순합"] = out["수입"] - out["지출"]
     return out.reset_index().sort_values("순합", ascending=False)
 
 def daily_net_series(df: pd.DataFrame, year_month: str):
     """
-    일자별 '순증감(수입-지출)' 시리즈 반환.
+    일자별 '순증감(수입-지출)' 시리즈 반환 (인덱스: 날짜).
     - 선 그래프에 사용.
     """
     if df.empty:
         return pd.Series(dtype=int)
 
-    dff = df[df["date"].str.startswith(year_month)].copy()
+    dff = _month_rows(df, year_month)
     if dff.empty:
         return pd.Series(dtype=int)
 
     # 수입은 +, 지출은 - 로 부호 적용
-    dff["sign_amt"] = dff.apply(lambda r: r["amount"] if r["type"] == "수입" else -r["amount"], axis=1)
-    ser = dff.groupby("date")["sign_amt"].sum().sort_index()
-    return ser
+    ser = signed_amount(dff).groupby(dff["date"]).sum().sort_index()
+    return ser.rename("sign_amt")
+
+@_memoized
+def user_daily_net_series(username: str, year_month: str) -> pd.Series:
+    """daily_net_series 를 사용자 원장의 그 달 거래로 계산"""
+    df = storage.get_backend().read_month(username, year_month)
+    return daily_net_series(df, year_month)
+
+# ---------- 기간(연도/최근 12개월/임의 기간) ----------
+@_memoized
+def range_summary(username: str, start, end) -> pd.DataFrame:
+    """
+    start~end(양 끝 포함) 카테고리별 수입/지출/순합 표 (month_summary 와 같은 형식)
+    - 누적합 색인에서 바로 계산 (기간 길이와 무관하게 카테고리 수 만큼만 계산)
+    """
+    with storage.io_lock:
+        index = range_index.for_user(username)
+        sums = index.sums(start, end)
+        categories = list(index.categories)
+    inc = pd.Series(sums[INCOME], index=categories)
+    exp = pd.Series(sums[1 - INCOME], index=categories)
+    used = (inc != 0) | (exp != 0)
+    if not used.any():
+        return pd.DataFrame(columns=["category", "수입", "지출", "순합"])
+    return _summary_table(inc[used], exp[used])
+
+def year_summary(username: str, year: int) -> pd.DataFrame:
+    """year 년(1월 1일 ~ 12월 31일) 카테고리별 표"""
+    return range_summary(username, f"{int(year):04d}-01-01", f"{int(year):04d}-12-31")
+
+@_memoized
+def range_net_series(username: str, start, end, freq: str = "D") -> pd.Series:
+    """
+    start~end 순증감(수입-지출) 시리즈 (freq="D" 일별, "M" 월별)
+    - 거래가 없는 날/달도 0 으로 포함
+    """
+    with storage.io_lock:
+        return range_index.for_user(username).net_series(start, end, freq)
@@ -3,17 +3,25 @@ from __future__ import annotations
 
 import json
 import hashlib
-import shutil
+import hmac
+import os
+import secrets
+import sys
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.config import PASSWORD_COST, PASSWORD_SCHEME
 
 # -------------------------------
 # 경로 상수
 # -------------------------------
 ROOT: Path = Path(__file__).resolve().parents[1]  # 프로젝트 루트(app, data, ui)
 DATA_DIR: Path = ROOT / "data"
-USERS_JSON: Path = DATA_DIR / "users.json"
+USERS_JSON: Path = DATA_DIR / "users.json"  # 이전 형식 (전체 사용자 한 파일) — 실행할 때 migrate_json 으로 USERS_DIR 로 옮김 (App.__init__)
+USERS_DIR: Path = DATA_DIR / "users"          # 사용자 1명당 파일 1개: <파일 이름용 username>.json
 AVATAR_DIR: Path = DATA_DIR / "avatars"
 
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -67,15 +75,109 @@ class User:
 # -------------------------------
 # 서비스
 # -------------------------------
+# -------------------------------
+# 비밀번호 해시
+# -------------------------------
+# 형식: "<방식>$<비용>$<salt hex>$<hash hex>"  (방식 이름이 곧 버전)
+# - scrypt: 비용 = N (r=8, p=1 고정)
+# - pbkdf2_sha256: 비용 = 반복 횟수
+# - '$' 가 없는 64자 16진수는 이전 형식(소금 없는 SHA-256)
+_SCRYPT_R, _SCRYPT_P = 8, 1
+
+
+def _derive(scheme: str, cost: int, pw: str, salt: bytes) -> bytes:
+    if scheme == "scrypt":
+        # 필요한 메모리(128*r*N)보다 넉넉하게 maxmem 지정 (기본 32MB 제한 회피)
+        return hashlib.scrypt(pw.encode("utf-8"), salt=salt, n=cost, r=_SCRYPT_R, p=_SCRYPT_P,
+                              maxmem=256 * _SCRYPT_R * cost + (1 << 20), dklen=32)
+    if scheme == "pbkdf2_sha256":
+        return hashlib.pbkdf2_hmac("sha256", pw.encode("utf-8"), salt, cost)
+    raise ValueError(f"알 수 없는 해시 방식: {scheme}")
+
+
+def _legacy_sha256(pw: str) -> str:
+    return hashlib.sha256(pw.encode("utf-8")).hexdigest()
+
+
+def hash_password(pw: str, scheme: Optional[str] = None, cost: Optional[int] = None) -> str:
+    """설정(PASSWORD_SCHEME/PASSWORD_COST) 또는 지정한 방식/비용으로 새 해시 문자열 생성"""
+    scheme = scheme or PASSWORD_SCHEME
+    cost = cost or PASSWORD_COST[scheme]
+    salt = secrets.token_bytes(16)
+    return f"{scheme}${cost}${salt.hex()}${_derive(scheme, cost, pw, salt).hex()}"
+
+
+def verify_password(pw: str, stored: str) -> bool:
+    """저장된 해시(새 형식/이전 SHA-256)와 비밀번호 비교 (상수 시간 비교)"""
+    if not stored:
+        return False
+    if "$" not in stored:
+        return hmac.compare_digest(_legacy_sha256(pw), stored)
+    try:
+        scheme, cost, salt, digest = stored.split("$")
+        derived = _derive(scheme, int(cost), pw, bytes.fromhex(salt))
+    except ValueError:
+        return False
+    return hmac.compare_digest(derived.hex(), digest)
+
+
+def needs_rehash(stored: str) -> bool:
+    """이전 형식이거나 현재 설정과 방식/비용이 다르면 True"""
+    if "$" not in stored:
+        return True
+    scheme, cost = stored.split("$", 2)[:2]
+    return scheme != PASSWORD_SCHEME or cost != str(PASSWORD_COST[PASSWORD_SCHEME])
+
+
+def calibrate(target_ms: float = 250, scheme: str = "scrypt") -> int:
+    """
+    이 PC에서 해시 한 번이 target_ms 근처가 되는 비용 추정.
+    - scrypt: N 을 2배씩 늘리며 target_ms 를 넘지 않는 가장 큰 값
+    - pbkdf2_sha256: 작은 반복 횟수로 재고 비례해서 계산
+    """
+    def measure(cost):
+        t0 = time.perf_counter()
+        _derive(scheme, cost, "calibrate", b"0" * 16)
+        return (time.perf_counter() - t0) * 1000
+
+    if scheme == "scrypt":
+        cost = 2 ** 12
+        while measure(cost * 2) <= target_ms:
+            cost *= 2
+        return cost
+    probe = 50_000
+    return max(1_000, int(probe * target_ms / max(measure(probe), 1e-3)) // 1_000 * 1_000)
+
+
+_SAFE_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+def _file_name(username: str) -> str:
+    """
+    username -> 파일 이름 (대소문자를 구분하지 않는 파일 시스템에서도 겹치지 않게)
+    - 소문자/숫자/-/_ 는 그대로, 나머지(대문자, 한글 등)는 UTF-8 바이트를 %XX 로
+    """
+    return "".join(
+        ch if ch in _SAFE_CHARS else "".join(f"%{b:02X}" for b in ch.encode("utf-8"))
+        for ch in username
+    ) + ".json"
+
+
 class AuthService:
     """
-    파일( users.json )을 사용하여 사용자 등록/로그인/조회/프로필 수정 기능을 제공합니다.
+    사용자별 레코드 파일(data/users/*.json)을 사용하여 사용자 등록/로그인/조회/프로필 수정 기능을 제공합니다.
+    - 한 명을 조회/수정할 때 그 사람 파일만 읽고 씀 (사용자 수와 무관한 비용)
+    - 읽은 레코드는 메모리에 두고 파일 스탬프(mtime_ns, size)가 같으면 다시 읽지 않음
+    - 쓰기는 임시 파일에 쓴 뒤 os.replace 로 교체 (중간에 끊겨도 반쪽 파일이 남지 않음)
     외부 공개 메서드(API) 시그니처는 기존과 동일합니다.
     """
 
     # ---------- 초기화 ----------
-    def __init__(self) -> None:
-        self._ensure_users_file()
+    def __init__(self, users_dir: Path = USERS_DIR) -> None:
+        # 화면 모듈이 import 될 때 만들어지므로 여기서는 파일/폴더를 건드리지 않음
+        self.users_dir = users_dir
+        self._index: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._lock = threading.RLock()  # 로그인 확인은 작업 스레드에서도 호출됨
 
     # ---------- Public API ----------
     def register(self, username: str, password: str, display_name: str) -> bool:
@@ -88,18 +190,15 @@ class AuthService:
         if not username or not password or not display_name:
             return False
 
-        db = self._load()
-        if username in db:
-            return False
-
-        db[username] = User(
-            username=username,
-            display_name=display_name.strip(),
-            password_hash=self._hash(password),
-            avatar=None,
-        ).to_dict()
-
-        self._save(db)
+        with self._lock:
+            if self._path(username).exists():
+                return False
+            self._save(User(
+                username=username,
+                display_name=display_name.strip(),
+                password_hash=self._hash(password),
+                avatar=None,
+            ).to_dict())
         return True
 
     def login(self, username: str, password: str) -> Optional[User]:
@@ -107,19 +206,30 @@ class AuthService:
         로그인 검증.
         - 성공: User 객체
         - 실패: None
+        - 해시 계산이 느리므로(의도된 비용) UI 에서는 작업 스레드에서 호출할 것
+        - 이전 형식/낮은 비용의 해시는 성공했을 때 현재 설정으로 다시 저장
         """
-        user_rec = self._load().get(username)
+        user_rec = self._load(username)
         if not user_rec:
             return None
 
-        if self._hash(password) != user_rec.get("password_hash"):
+        stored = user_rec.get("password_hash") or ""
+        if not verify_password(password, stored):
             return None
 
+        if needs_rehash(stored):
+            with self._lock:
+                rec = dict(self._load(username) or user_rec)
+                if rec.get("password_hash") == stored:  # 그 사이 비번이 바뀌지 않았을 때만
+                    rec["password_hash"] = self._hash(password)
+                    self._save(rec)
+                user_rec = rec
+
         return User.from_dict(user_rec)
 
     def get_user(self, username: str) -> Optional[User]:
         """username으로 사용자 레코드를 조회."""
-        rec = self._load().get(username)
+        rec = self._load(username)
         return User.from_dict(rec) if rec else None
 
     def update_profile(
@@ -137,27 +247,26 @@ class AuthService:
         - new_password: 4자 이상이면 비번 갱신
         - avatar_src_path: 이미지 경로를 data/avatars/<username>.<ext> 로 복사
         """
-        db = self._load()
-        if username not in db:
-            return None
-
-        rec = db[username]
+        with self._lock:
+            rec = self._load(username)
+            if rec is None:
+                return None
+            rec = dict(rec)
 
-        if display_name and display_name.strip():
-            rec["display_name"] = display_name.strip()
+            if display_name and display_name.strip():
+                rec["display_name"] = display_name.strip()
 
-        if new_password and new_password.strip():
-            if len(new_password) >= 4:
-                rec["password_hash"] = self._hash(new_password)
-            # 4자 미만은 UI에서 이미 걸러지지만, 여기선 조용히 무시
+            if new_password and new_password.strip():
+                if len(new_password) >= 4:
+                    rec["password_hash"] = self._hash(new_password)
+                # 4자 미만은 UI에서 이미 걸러지지만, 여기선 조용히 무시
 
-        if avatar_src_path:
-            saved = self._copy_avatar(username, Path(avatar_src_path))
-            if saved is not None:
-                rec["avatar"] = saved  # 문자열 경로
+            if avatar_src_path:
+                saved = self._copy_avatar(username, Path(avatar_src_path))
+                if saved is not None:
+                    rec["avatar"] = saved  # 문자열 경로
 
-        db[username] = rec
-        self._save(db)
+            self._save(rec)
 
         updated = User.from_dict(rec)
 
@@ -169,47 +278,103 @@ class AuthService:
         return updated
 
     # ---------- 내부 헬퍼 ----------
-    def _ensure_users_file(self) -> None:
-        """users.json 파일이 없으면 빈 객체로 생성."""
-        if not USERS_JSON.exists():
-            self._write_json(USERS_JSON, {})
-
-    def _load(self) -> Dict[str, Dict[str, Any]]:
-        """users.json을 읽어 dict 반환. 실패 시 빈 dict."""
-        self._ensure_users_file()
+    def _path(self, username: str) -> Path:
+        return self.users_dir / _file_name(username)
+
+    def _load(self, username: str) -> Optional[Dict[str, Any]]:
+        """사용자 한 명의 레코드 (없거나 읽기 실패면 None). 파일이 그대로면 메모리 값을 씀"""
+        path = self._path(username)
+        with self._lock:
+            try:
+                st = path.stat()
+            except OSError:
+                self._index.pop(username, None)
+                return None
+            stamp = (st.st_mtime_ns, st.st_size)
+            hit = self._index.get(username)
+            if hit is not None and hit[0] == stamp:
+                return hit[1]
+            try:
+                rec = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                return None
+            self._index[username] = (stamp, rec)
+            return rec
+
+    def _save(self, rec: Dict[str, Any]) -> None:
+        """레코드 한 건을 그 사용자 파일에만 저장 (임시 파일 -> os.replace)"""
+        path = self._path(rec["username"])
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_json(path, rec)
+            st = path.stat()
+            self._index[rec["username"]] = ((st.st_mtime_ns, st.st_size), rec)
+
+    def migrate_json(self, legacy: Path = USERS_JSON) -> int:
+        """
+        이전 users.json 이 있으면 사용자별 파일로 나누고 users.json.bak 으로 보관 (한 번만).
+        - 프로그램 시작 때 명시적으로 호출 (App.__init__), 옮긴 사용자 수 반환
+        - 이미 사용자 파일이 있는 사람은 덮어쓰지 않음
+        """
+        if not legacy.exists():
+            return 0
         try:
-            return json.loads(USERS_JSON.read_text(encoding="utf-8"))
+            db = json.loads(legacy.read_text(encoding="utf-8"))
         except Exception:
-            return {}
-
-    def _save(self, db: Dict[str, Dict[str, Any]]) -> None:
-        """dict를 users.json에 저장(UTF-8, pretty)."""
-        self._write_json(USERS_JSON, db)
+            return 0  # 읽을 수 없는 파일은 건드리지 않음
+        moved = 0
+        with self._lock:
+            for username, rec in db.items():
+                rec = dict(rec, username=rec.get("username") or username)
+                if not self._path(rec["username"]).exists():
+                    self._save(rec)
+                    moved += 1
+        os.replace(legacy, legacy.with_name(legacy.name + ".bak"))
+        return moved
 
     @staticmethod
     def _hash(pw: str) -> str:
-        """SHA-256 해시(16진수 문자열)"""
-        return hashlib.sha256(pw.encode("utf-8")).hexdigest()
+        """현재 설정의 비밀번호 해시 문자열"""
+        return hash_password(pw)
 
     @staticmethod
     def _write_json(path: Path, obj: Any) -> None:
-        """JSON 안전 저장(UTF-8, 한글 그대로, 들여쓰기)."""
-        path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+        """JSON 안전 저장(UTF-8, 한글 그대로, 들여쓰기). 임시 파일에 쓴 뒤 교체"""
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
 
     @staticmethod
     def _copy_avatar(username: str, src: Path) -> Optional[str]:
         """
-        아바타 파일을 data/avatars/<username>.<ext> 로 복사.
-        - src가 없거나 복사 실패 시 None
+        아바타를 data/avatars/<username>.png 로 줄여 저장하고 썸네일도 만듦 (services.avatars).
+        - src가 없거나 저장 실패 시 None
         - 성공 시 저장된 경로 문자열 반환
         """
         if not src.exists():
             return None
 
-        ext = src.suffix.lower() or ".png"
-        dst = AVATAR_DIR / f"{username}{ext}"
+        from services import avatars  # Pillow 는 아바타를 바꿀 때만 (로그인 화면에서는 불필요)
         try:
-            shutil.copyfile(src, dst)
-            return str(dst)
+            dst = avatars.save_avatar(src, AVATAR_DIR, _file_name(username)[:-len(".json")])
         except Exception:
             return None
+        return str(dst) if dst is not None else None
+
+
+# -------------------------------
+# CLI: 해시 비용 맞추기
+# -------------------------------
+def _main(argv: List[str]) -> int:
+    if not argv or argv[0] != "calibrate":
+        print("사용법: python -m services.auth calibrate [목표ms]")
+        return 2
+    target = float(argv[1]) if len(argv) > 1 else 250
+    for scheme in ("scrypt", "pbkdf2_sha256"):
+        print(f"{scheme}: {calibrate(target, scheme)}  (목표 {target:.0f} ms)")
+    print("app/config.py 의 PASSWORD_COST 에 반영하세요.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
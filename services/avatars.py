@@ -0,0 +1,81 @@
+# services/avatars.py
+"""
+아바타 이미지 정리/썸네일
+- 업로드 때 원본(휴대폰 사진 등)을 AVATAR_MAX 이하 PNG 로 줄여 저장하고 THUMB_SIZES 썸네일을 미리 만듦
+- 썸네일 파일: <아바타 파일 이름>.<크기>.png (아바타와 같은 폴더)
+  ('.' 은 사용자 파일 이름에서 항상 %2E 로 바뀌므로 다른 사용자의 아바타 이름과 겹치지 않음)
+- Pillow 가 없으면 원본을 그대로 복사 (썸네일 없음)
+"""
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Optional
+
+try:
+    from PIL import Image, ImageOps  # type: ignore
+    HAVE_PIL = True
+except Exception:
+    HAVE_PIL = False
+
+AVATAR_MAX = 512
+THUMB_SIZES = (120, 96, 28)  # 프로필 설정 미리보기 / 홈 프로필 카드 / 상단바
+
+
+def thumbnail_path(avatar: Path, size: int) -> Path:
+    # '_' 는 사용자 이름에 쓸 수 있어 'kim' 의 96 썸네일이 'kim_96' 의 아바타와 겹치므로 '.' 으로 구분
+    return avatar.with_name(f"{avatar.stem}.{size}.png")
+
+
+def open_scaled(src: Path, size: int):
+    """size 에 맞게 줄인 RGB(A) 이미지 (JPEG 는 draft 로 작게 디코딩)"""
+    im = Image.open(src)
+    im.draft("RGB", (size, size))
+    im = ImageOps.exif_transpose(im)
+    im = im.convert("RGBA" if "A" in im.getbands() or "transparency" in im.info else "RGB")
+    im.thumbnail((size, size))
+    return im
+
+
+def save_avatar(src: Path, dst_dir: Path, stem: str) -> Optional[Path]:
+    """
+    src 를 dst_dir/<stem>.png 로 정리해 저장하고 썸네일 생성, 저장된 경로 반환
+    - 열 수 없는 이미지면 None
+    """
+    if not HAVE_PIL:
+        dst = dst_dir / f"{stem}{src.suffix.lower() or '.png'}"
+        shutil.copyfile(src, dst)
+        return dst
+
+    try:
+        im = open_scaled(src, AVATAR_MAX)
+    except Exception:
+        return None
+    dst = dst_dir / f"{stem}.png"
+    im.save(dst, "PNG")
+    for size in THUMB_SIZES:
+        thumb = im.copy()
+        thumb.thumbnail((size, size))
+        thumb.save(thumbnail_path(dst, size), "PNG")
+    return dst
+
+
+def thumbnail(avatar: Path, size: int, *, create: bool = True) -> Optional[Path]:
+    """
+    avatar 의 size 썸네일 경로.
+    - 없거나 아바타보다 오래됐으면 create=True 일 때 만들어 둠 (이전에 올린 아바타 대응)
+    - 만들 수 없으면 None (호출측에서 원본을 직접 줄여 씀)
+    """
+    thumb = thumbnail_path(avatar, size)
+    try:
+        if thumb.stat().st_mtime_ns >= avatar.stat().st_mtime_ns:
+            return thumb
+    except OSError:
+        pass
+    if not (create and HAVE_PIL and avatar.exists()):
+        return None
+    try:
+        open_scaled(avatar, size).save(thumb, "PNG")
+    except Exception:
+        return None
+    return thumb
@@ -0,0 +1,155 @@
+# services/importer.py
+"""
+외부(은행/카드 명세서) CSV 대량 가져오기
+- 큰 파일도 CHUNK_ROWS 행씩 읽어 열 대응/형식 검사를 묶음으로 처리
+- 통과한 행은 모아서 원장에 한 번에 추가 (StorageBackend.append_frame, 파일 쓰기 1회)
+- 형식이 잘못된 행은 건너뛰고 '줄 번호: 사유' 로 돌려줌
+- 실행: python -m services.importer <username> <파일.csv>  (열 이름은 guess_mapping 으로 추정)
+"""
+from __future__ import annotations
+
+import codecs
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.config import DATE_FMT
+from services import storage
+
+FIELDS = ["date", "type", "category", "description", "amount"]
+REQUIRED = ["date", "amount"]  # 구분이 없으면 금액 부호로, 카테고리가 없으면 기본값으로
+CHUNK_ROWS = 50_000
+ENCODINGS = ("utf-8-sig", "cp949")  # 국내 은행/카드사 파일은 cp949 가 많음
+
+# 자주 쓰이는 열 이름 -> 가계부 필드
+_ALIASES = {
+    "date": ["date", "날짜", "일자", "거래일", "거래일자", "거래일시", "이용일", "이용일자", "승인일자"],
+    "type": ["type", "구분", "입출금구분", "거래구분"],
+    "category": ["category", "카테고리", "분류", "업종"],
+    "description": ["description", "설명", "내용", "적요", "거래내용", "가맹점", "가맹점명", "이용가맹점", "메모"],
+    "amount": ["amount", "금액", "거래금액", "이용금액", "승인금액"],
+}
+_TYPE_ALIASES = {"입금": "수입", "출금": "지출", "수입": "수입", "지출": "지출"}
+
+
+@dataclass
+class ImportResult:
+    added: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def sniff_encoding(path: Path) -> str:
+    """앞부분(64KB)을 디코딩해 보고 맞는 인코딩 선택"""
+    with open(path, "rb") as f:
+        head = f.read(1 << 16)
+    for enc in ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(enc)().decode(head, final=False)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return ENCODINGS[0]
+
+
+def read_columns(path: Path) -> List[str]:
+    return list(pd.read_csv(path, nrows=0, encoding=sniff_encoding(path)).columns)
+
+
+def guess_mapping(columns: List[str]) -> Dict[str, str]:
+    """열 이름으로 필드 대응 추정: {필드: 원본 열 이름} (못 찾은 필드는 빠짐)"""
+    normalized = {c.strip().lower(): c for c in columns}
+    mapping = {}
+    for f, names in _ALIASES.items():
+        for name in names:
+            if name in normalized:
+                mapping[f] = normalized[name]
+                break
+    return mapping
+
+
+def count_rows(path: Path) -> int:
+    """데이터 행 수 (진행률 계산용, 줄바꿈 개수로 빠르게 셈)"""
+    n = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            n += block.count(b"\n")
+    return max(n - 1, 0)
+
+
+def _convert(chunk: pd.DataFrame, mapping: Dict[str, str], default_category: str) -> pd.DataFrame:
+    """원본 열 -> 가계부 필드 문자열 DataFrame (검사는 storage._coerce 가 함)"""
+    out = pd.DataFrame(index=chunk.index)
+    for f in FIELDS:
+        out[f] = chunk[mapping[f]].str.strip() if f in mapping else ""
+
+    # 날짜: 2025.08.01 / 2025/08/01 / 2025-08-01 12:30 -> 2025-08-01 (못 읽으면 원문 유지 -> 오류로 보고)
+    dates = pd.to_datetime(out["date"].str.replace(r"[./]", "-", regex=True).str[:10],
+                           format=DATE_FMT, errors="coerce")
+    out["date"] = dates.dt.strftime(DATE_FMT).where(dates.notna(), out["date"])
+
+    # 금액: 쉼표/원/공백 제거, 구분 열이 없으면 음수 = 지출
+    amount = out["amount"].str.replace(r"[,\s원₩]", "", regex=True)
+    if "type" in mapping:
+        out["type"] = out["type"].map(_TYPE_ALIASES).fillna(out["type"])
+        out["amount"] = amount.str.lstrip("-")
+    else:
+        negative = amount.str.startswith("-")
+        out["type"] = np.where(negative, "지출", "수입")
+        out["amount"] = amount.str.lstrip("-")
+
+    out["category"] = out["category"].mask(out["category"] == "", default_category)
+    return out
+
+
+def import_csv(username: str, path: Path, mapping: Dict[str, str], *,
+               default_category: str = "기타", chunk_rows: int = CHUNK_ROWS,
+               progress: Optional[Callable[[int, int], None]] = None,
+               backend: Optional[storage.StorageBackend] = None) -> ImportResult:
+    """
+    path 의 거래를 username 원장에 추가.
+    - mapping: {필드: 원본 열 이름}, date/amount 는 필수
+    - progress(읽은 행 수, 전체 행 수): 묶음마다 호출 (작업 스레드에서 불릴 수 있음)
+    - 원장 쓰기는 마지막에 한 번 (중간에 오류가 나면 아무것도 추가되지 않음)
+    """
+    path = Path(path)
+    missing = [f for f in REQUIRED if f not in mapping]
+    if missing:
+        raise ValueError(f"필수 열이 지정되지 않았습니다: {', '.join(missing)}")
+
+    total = count_rows(path)
+    reader = pd.read_csv(path, dtype=str, keep_default_na=False, encoding=sniff_encoding(path),
+                         usecols=sorted(set(mapping.values())), chunksize=chunk_rows)
+    frames, result, done = [], ImportResult(), 0
+    for chunk in reader:
+        df, bad = storage._coerce(_convert(chunk, mapping, default_category), first_line=done + 2)
+        frames.append(df)
+        result.errors.extend(bad)
+        done += len(chunk)
+        if progress is not None:
+            progress(done, total)
+
+    result.added = (backend or storage.get_backend()).append_frame(username, storage._concat(frames))
+    return result
+
+
+def _main(argv: List[str]) -> int:
+    if len(argv) != 2:
+        print("사용법: python -m services.importer <username> <파일.csv>")
+        return 2
+    username, path = argv[0], Path(argv[1])
+    mapping = guess_mapping(read_columns(path))
+    print("열 대응:", mapping)
+    result = import_csv(username, path, mapping,
+                        progress=lambda done, total: print(f"\r{done:,}/{total:,}", end="", flush=True))
+    print(f"\n추가 {result.added:,}건, 제외 {len(result.errors):,}건")
+    for e in result.errors[:10]:
+        print(" ", e)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -0,0 +1,188 @@
+# services/partitioned_backend.py
+"""
+월별 분할 CSV 거래 저장소
+- LEDGER_DIR/<user>/YYYY-MM.csv 에 그 달의 거래만 저장
+- 추가는 해당 월 파일 끝에 한 줄, 한 달 조회는 그 달 파일 하나만 읽음
+- 기존 단일 파일(transactions_<user>.csv)이 있으면 함께 읽음 (호환)
+- 단일 파일 -> 월별 파일 분할: python -m services.partitioned_backend <username> [...]
+"""
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from app.config import DATE_FMT, LEDGER_DIR
+from services import storage
+from services.storage import StorageBackend, _concat, _day
+
+_MONTH_FILE = re.compile(r"^\d{4}-\d{2}\.csv$")
+
+
+class PartitionedCsvBackend(StorageBackend):
+    """StorageBackend 의 월별 분할 CSV 구현"""
+    name = "partitioned"
+
+    def __init__(self, root: Path = LEDGER_DIR) -> None:
+        self.root = Path(root)
+        # 전체 조회 결과 캐시: username -> (파일 스탬프 목록, DataFrame)
+        self._all: Dict[str, Tuple[tuple, pd.DataFrame]] = {}
+
+    # ---------- 경로 ----------
+    def user_dir(self, username: str) -> Path:
+        return self.root / username
+
+    def partition_path(self, username: str, year_month: str) -> Path:
+        return self.user_dir(username) / f"{year_month}.csv"
+
+    def partitions(self, username: str) -> List[Path]:
+        """월 순서로 정렬된 분할 파일 목록"""
+        d = self.user_dir(username)
+        if not d.is_dir():
+            return []
+        return sorted(p for p in d.iterdir() if _MONTH_FILE.match(p.name))
+
+    def _legacy(self, username: str):
+        """기존 단일 파일 (있을 때만)"""
+        path = storage.csv_path_for_user(username)
+        return path if path.exists() else None
+
+    def _paths(self, username: str) -> List[Path]:
+        """기존 단일 파일(있으면) + 월 파일들"""
+        legacy = self._legacy(username)
+        return ([legacy] if legacy is not None else []) + self.partitions(username)
+
+    @staticmethod
+    def _month_of(row: Dict) -> str:
+        date = row.get("date", "")
+        try:
+            return _day(date).strftime("%Y-%m")
+        except (ValueError, TypeError):
+            raise ValueError(f"날짜 형식이 잘못되었습니다: {date!r}")
+
+    # ---------- StorageBackend ----------
+    def read_all(self, username: str) -> pd.DataFrame:
+        paths = self._paths(username)
+        stamps = tuple((str(p), storage._stamp(p)) for p in paths)
+        hit = self._all.get(username)
+        if hit is not None and hit[0] == stamps:
+            return hit[1]
+        # 월 파일은 각각 날짜순이고 월 순서로 이어지므로, 기존 단일 파일이 섞일 때만 정렬됨
+        df = storage._sort_by_date(_concat([storage.read_all(p) for p in paths]))
+        self._all[username] = (stamps, df)
+        return df
+
+    def ledger_stamp(self, username: str):
+        return tuple((p.name, storage._stamp(p)) for p in self._paths(username))
+
+    def slice_dates(self, username: str, start, end) -> pd.DataFrame:
+        return self.read_range(username, start, end)
+
+    def read_range(self, username: str, start, end) -> pd.DataFrame:
+        """start ~ end 에 걸친 월 파일만 읽음 (날짜순)"""
+        start, end = _day(start), _day(end)
+        months = pd.period_range(start, end, freq="M").strftime("%Y-%m")
+        frames = []
+        for ym in months:
+            path = self.partition_path(username, ym)
+            if path.exists():
+                frames.append(storage.read_all(path))
+        legacy = self._legacy(username)
+        if legacy is not None:
+            frames.append(storage.read_all(legacy))
+        df = storage._sort_by_date(_concat(frames))
+        return storage.slice_dates(df, start, end).reset_index(drop=True)
+
+    def _append_row(self, username: str, row: Dict):
+        path = self.partition_path(username, self._month_of(row))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        storage.append_row(row, path)
+
+    def _append_frame(self, username: str, df: pd.DataFrame):
+        """월별로 나눠 해당 월 파일 끝에 한 번씩만 덧붙임"""
+        for ym, part in df.groupby(df["date"].dt.strftime("%Y-%m"), sort=True):
+            path = self.partition_path(username, ym)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            storage.append_frame(part, path)
+
+    def _delete_ids(self, username: str, ids: set) -> pd.DataFrame:
+        """지울 거래가 있는 월 파일만 다시 씀"""
+        df = self.read_all(username)
+        hits = df[df["id"].isin(list(ids))]
+        if hits.empty:
+            return hits
+        paths = [self.partition_path(username, ym) for ym in hits["date"].dt.strftime("%Y-%m").unique()]
+        legacy = self._legacy(username)
+        if legacy is not None:
+            paths.append(legacy)
+        removed = [storage.delete_ids(ids, p) for p in paths if p.exists()]
+        return _concat(removed)
+
+    def _overwrite(self, username: str, df: pd.DataFrame):
+        """월별로 나눠 다시 씀 (빈 달 파일은 삭제, 기존 단일 파일은 .bak 으로 보관)"""
+        self.user_dir(username).mkdir(parents=True, exist_ok=True)
+        written = set()
+        if len(df):
+            months = pd.to_datetime(df["date"], format=DATE_FMT).dt.strftime("%Y-%m")
+            for ym, part in df.groupby(months.values, sort=True):
+                path = self.partition_path(username, ym)
+                storage.overwrite(part, path)
+                written.add(path)
+        for path in self.partitions(username):
+            if path not in written:
+                path.unlink()
+                storage.evict(path)
+        self._retire_legacy(username)
+        self._all.pop(username, None)
+
+    def load_errors(self, username: str) -> List[str]:
+        return [f"{p.name} {e}" for p in self._paths(username) for e in storage.load_errors(p)]
+
+    def evict(self, username: str):
+        self._all.pop(username, None)
+        for path in self._paths(username):
+            storage.evict(path)
+
+    # ---------- 단일 파일 분할 ----------
+    def _retire_legacy(self, username: str):
+        """기존 단일 파일을 .bak 으로 보관 (이미 있으면 .bak.1, .bak.2 ... 처럼 비어 있는 이름으로)"""
+        legacy = self._legacy(username)
+        if legacy is not None:
+            storage.evict(legacy)
+            backup = legacy.with_name(legacy.name + ".bak")
+            n = 0
+            while backup.exists():  # 이전 분할 때의 백업이 유일한 사본일 수 있으므로 덮어쓰지 않음
+                n += 1
+                backup = legacy.with_name(f"{legacy.name}.bak.{n}")
+            legacy.rename(backup)
+
+    def split_legacy(self, username: str) -> int:
+        """
+        transactions_<user>.csv 를 월별 파일로 나누고 원본은 .bak 으로 보관 (기존 .bak 은 덮어쓰지 않음).
+        - 이미 분할 파일이 있으면 합쳐서 다시 씀
+        - 옮긴 전체 건수 반환
+        """
+        df = self.read_all(username)
+        self.overwrite(username, df)
+        return len(df)
+
+
+def _main(argv: List[str]) -> int:
+    if not argv:
+        print("사용법: python -m services.partitioned_backend <username> [...]")
+        return 2
+    backend = PartitionedCsvBackend()
+    for username in argv:
+        if backend._legacy(username) is None:
+            print(f"{username}: 단일 파일 없음, 건너뜀")
+            continue
+        n = backend.split_legacy(username)
+        print(f"{username}: {n}건, {len(backend.partitions(username))}개 월 파일로 분할")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -0,0 +1,150 @@
+# services/range_index.py
+"""
+날짜 범위 합계용 누적합(prefix sum) 색인: 사용자별로 메모리에 하나
+- cum[구분, 카테고리, i] = 첫 날부터 i-1 번째 날까지의 금액 합 (i = 0 이면 0)
+- 어떤 기간의 카테고리별 수입/지출 = cum[..., 끝] - cum[..., 시작] → 기간 길이와 무관
+- 거래 추가/삭제는 바뀐 날 이후 누적값만 더하고 빼서 반영 (storage 쓰기 후 on_write)
+- 만들 때의 원장 스탬프(ledger_stamp)를 기억해, 앱 밖에서 원장이 바뀌었으면 조회 때 다시 만듦
+- 크기: 구분 2 x 카테고리 수 x 날짜 수 (10년, 카테고리 20개면 약 1MB)
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.config import TYPES
+from models.transaction_store import INCOME, day_number
+from services import storage
+
+
+def _days(dates: pd.Series) -> np.ndarray:
+    """datetime64 시리즈 -> 1970-01-01 부터의 일수"""
+    return dates.to_numpy().astype("datetime64[D]").astype(np.int64)
+
+
+class RangeIndex:
+    """한 사용자 원장의 구분/카테고리별 일자 누적합"""
+
+    def __init__(self, df: pd.DataFrame, stamp=None):
+        self.stamp = stamp  # 이 색인이 반영한 원장의 ledger_stamp
+        self.categories: List[str] = []
+        self._code: Dict[str, int] = {}
+        self.first = 0  # cum 의 0번째 날 (일수)
+        self.cum = np.zeros((len(TYPES), 0, 1), dtype=np.int64)
+        self.apply(df, +1)
+
+    @property
+    def n_days(self) -> int:
+        return self.cum.shape[2] - 1
+
+    # ---------- 조회 ----------
+    def _bounds(self, start, end) -> Tuple[int, int]:
+        """start~end(포함) -> cum 위치 (lo, hi), 색인 밖은 잘라냄"""
+        lo = min(max(day_number(start) - self.first, 0), self.n_days)
+        hi = min(max(day_number(end) - self.first + 1, 0), self.n_days)
+        return lo, max(lo, hi)
+
+    def sums(self, start, end) -> np.ndarray:
+        """기간 합계 배열 [구분, 카테고리]"""
+        lo, hi = self._bounds(start, end)
+        return self.cum[:, :, hi] - self.cum[:, :, lo]
+
+    def net_series(self, start, end, freq: str = "D") -> pd.Series:
+        """
+        기간의 순증감(수입-지출) 시리즈 (인덱스: 날짜, 거래가 없는 날도 0 으로 포함)
+        - freq="M" 이면 월별 합 (인덱스: 그 달 1일)
+        """
+        lo, hi = self._bounds(start, end)
+        if lo == hi:
+            return pd.Series(dtype="int64", name="sign_amt")
+        sign = np.where(np.arange(len(TYPES)) == INCOME, 1, -1)
+        net = np.tensordot(sign, self.cum[:, :, lo:hi + 1].sum(axis=1), axes=1)  # 구간 누적 순합
+        days = (np.arange(lo, hi) + self.first).astype("datetime64[D]")
+        if freq == "M":
+            months = days.astype("datetime64[M]")
+            edges = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+            values = np.diff(net[np.r_[edges, hi - lo]])
+            index = pd.DatetimeIndex(months[edges].astype("datetime64[D]"))
+        else:
+            values = np.diff(net)
+            index = pd.DatetimeIndex(days)
+        return pd.Series(values, index=index, name="sign_amt")
+
+    # ---------- 갱신 ----------
+    def _extend(self, lo_day: int, hi_day: int, categories: pd.Series):
+        """날짜 범위/카테고리 목록을 넓힘 (새 칸: 앞쪽은 0, 뒤쪽은 마지막 누적값)"""
+        new = [c for c in pd.unique(categories.astype(str)) if c not in self._code]
+        for c in new:
+            self._code[c] = len(self.categories)
+            self.categories.append(c)
+        if self.cum.shape[1] == 0 and self.n_days == 0:
+            self.first = lo_day
+        before = max(self.first - lo_day, 0)
+        after = max(hi_day - (self.first + self.n_days - 1), 0)
+        if new or before or after:
+            self.cum = np.pad(self.cum, ((0, 0), (0, len(new)), (0, 0)))
+            self.cum = np.pad(self.cum, ((0, 0), (0, 0), (before, 0)))
+            self.cum = np.pad(self.cum, ((0, 0), (0, 0), (0, after)), mode="edge")
+            self.first -= before
+
+    def apply(self, df: pd.DataFrame, sign: int):
+        """거래(read_all 형식)를 더함(sign=+1) 또는 뺌(-1)"""
+        if df.empty:
+            return
+        days = _days(df["date"])
+        self._extend(int(days.min()), int(days.max()), df["category"])
+        t = pd.Categorical(df["type"].astype(str), categories=TYPES).codes.astype(np.int64)
+        cat = df["category"]
+        if not isinstance(cat.dtype, pd.CategoricalDtype):
+            cat = cat.astype(str).astype("category")
+        # 실제로 쓰이지 않는 카테고리 값(-1)은 아래에서 참조되지 않음
+        remap = np.array([self._code.get(str(x), -1) for x in cat.cat.categories], dtype=np.int64)
+        c = remap[cat.cat.codes.to_numpy()]
+        delta = np.zeros_like(self.cum)
+        np.add.at(delta, (t, c, days - self.first + 1), sign * df["amount"].to_numpy(dtype=np.int64))
+        self.cum += np.cumsum(delta, axis=2)
+
+
+# username -> RangeIndex
+_indexes: Dict[str, RangeIndex] = {}
+
+
+def for_user(username: str) -> RangeIndex:
+    """사용자 색인 (없거나 원장이 바뀌었으면 원장에서 만듦)"""
+    with storage.io_lock:
+        backend = storage.get_backend()
+        stamp = backend.ledger_stamp(username)
+        index = _indexes.get(username)
+        if index is None or index.stamp != stamp:
+            # 스탬프를 먼저 읽음: 읽는 도중 원장이 바뀌면 다음 조회 때 다시 만듦
+            index = _indexes[username] = RangeIndex(backend.read_all(username), stamp)
+        return index
+
+
+def on_write(username: str, added: Optional[pd.DataFrame] = None,
+             removed: Optional[pd.DataFrame] = None, before=None):
+    """
+    storage 쓰기 후 호출됨.
+    - 전체 교체(둘 다 None)거나 색인이 쓰기 직전 원장(before)과 이미 어긋나 있었으면
+      색인을 버리고 다음 조회 때 다시 만듦
+    """
+    with storage.io_lock:
+        index = _indexes.get(username)
+        if index is None:
+            return
+        if (added is None and removed is None) or index.stamp != before:
+            del _indexes[username]
+            return
+        if added is not None:
+            index.apply(added, +1)
+        if removed is not None:
+            index.apply(removed, -1)
+        index.stamp = storage.get_backend().ledger_stamp(username)
+
+
+def drop(username: str):
+    """메모리에서 색인 제거 (로그아웃 등)"""
+    with storage.io_lock:
+        _indexes.pop(username, None)
@@ -0,0 +1,245 @@
+# services/sqlite_backend.py
+"""
+SQLite 거래 저장소 (표준 라이브러리 sqlite3, WAL 모드)
+- 한 파일(LEDGER_DB)에 모든 사용자의 거래를 username 컬럼으로 구분해 저장
+- 한 건 추가/삭제, 날짜 구간 조회를 전체를 읽지 않고 처리
+- CSV -> SQLite 일회성 이전: python -m services.sqlite_backend <username> [...]
+"""
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from app.config import DATE_FMT, LEDGER_DB
+from models.transaction import new_ids
+from services import storage
+from services.storage import COLUMNS, StorageBackend, _concat, _day, _empty_frame, _row_values, _with_categories
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id          INTEGER PRIMARY KEY,
+    username    TEXT    NOT NULL,
+    date        TEXT    NOT NULL,   -- YYYY-MM-DD
+    type        TEXT    NOT NULL,
+    category    TEXT    NOT NULL,
+    description TEXT    NOT NULL DEFAULT '',
+    amount      INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_tx_user_date ON transactions(username, date);
+CREATE INDEX IF NOT EXISTS ix_tx_user_category ON transactions(username, category);
+
+-- 사용자별 원장 버전: 거래가 바뀔 때마다 트리거가 1씩 올림 (sqlite3 셸 등 다른 프로그램이 고쳐도)
+CREATE TABLE IF NOT EXISTS ledger_versions (
+    username TEXT PRIMARY KEY,
+    version  INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS tr_tx_insert AFTER INSERT ON transactions BEGIN
+    INSERT INTO ledger_versions (username, version) VALUES (NEW.username, 1)
+    ON CONFLICT (username) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS tr_tx_delete AFTER DELETE ON transactions BEGIN
+    INSERT INTO ledger_versions (username, version) VALUES (OLD.username, 1)
+    ON CONFLICT (username) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS tr_tx_update AFTER UPDATE ON transactions BEGIN
+    INSERT INTO ledger_versions (username, version) VALUES (OLD.username, 1)
+    ON CONFLICT (username) DO UPDATE SET version = version + 1;
+    INSERT INTO ledger_versions (username, version) VALUES (NEW.username, 1)
+    ON CONFLICT (username) DO UPDATE SET version = version + 1;
+END;
+"""
+
+_INSERT = ("INSERT INTO transactions (id, username, date, type, category, description, amount) "
+           "VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+# IN (?, ...) 한 번에 넣는 id 수 (SQLite 변수 개수 한도 SQLITE_MAX_VARIABLE_NUMBER 는 이전 버전에서 999)
+_ID_CHUNK = 900
+
+
+class SqliteBackend(StorageBackend):
+    """StorageBackend 의 SQLite 구현"""
+    name = "sqlite"
+
+    def __init__(self, db_path: Path = LEDGER_DB) -> None:
+        self.db_path = Path(db_path)
+        # UI 스레드와 작업 스레드가 함께 쓰므로 연결 하나를 잠금으로 보호
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # 사용자별 전체 조회 캐시: username -> (data_version, DataFrame)
+        self._cache: Dict[str, tuple] = {}
+
+    # ---------- 내부 헬퍼 ----------
+    def _data_version(self) -> int:
+        """다른 연결이 커밋하면 바뀌는 값 (자기 쓰기는 _cache 정리로 처리)"""
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _query(self, sql: str, params: Iterable) -> pd.DataFrame:
+        with self._lock:
+            rows = self._conn.execute(sql, tuple(params)).fetchall()
+        if not rows:
+            return _empty_frame()
+        df = pd.DataFrame(rows, columns=COLUMNS)
+        df["id"] = df["id"].astype("int64")
+        df["date"] = pd.to_datetime(df["date"], format=DATE_FMT)
+        df["amount"] = df["amount"].astype("int64")
+        return _with_categories(df)
+
+    def _taken_ids(self, ids: List[int]) -> set:
+        """ids 중 이미 (어느 사용자든) 쓰이고 있는 id (_ID_CHUNK 개씩 나눠 조회)"""
+        taken = set()
+        with self._lock:
+            for i in range(0, len(ids), _ID_CHUNK):
+                chunk = ids[i:i + _ID_CHUNK]
+                taken.update(r[0] for r in self._conn.execute(
+                    f"SELECT id FROM transactions WHERE id IN ({','.join('?' * len(chunk))})", chunk))
+        return taken
+
+    @staticmethod
+    def _values(username: str, row: Dict) -> tuple:
+        id_, date, type_, category, description, amount = _row_values(row)
+        return int(id_), username, date, type_, category, description, int(amount)
+
+    # ---------- StorageBackend ----------
+    def read_all(self, username: str) -> pd.DataFrame:
+        """
+        사용자 거래 전체
+        - 이 객체나 다른 프로세스가 쓰지 않았다면 캐시된 DataFrame 반환
+        """
+        with self._lock:
+            version = self._data_version()
+            hit = self._cache.get(username)
+            if hit is not None and hit[0] == version:
+                return hit[1]
+            df = self._query(
+                "SELECT id, date, type, category, description, amount FROM transactions "
+                "WHERE username = ? ORDER BY date, id", (username,))
+            self._cache[username] = (version, df)
+            return df
+
+    def ledger_stamp(self, username: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM ledger_versions WHERE username = ?", (username,)).fetchone()
+        return row[0] if row else 0
+
+    def slice_dates(self, username: str, start, end) -> pd.DataFrame:
+        return self.read_range(username, start, end)
+
+    def read_range(self, username: str, start, end) -> pd.DataFrame:
+        """start ~ end (양 끝 포함): (username, date) 인덱스로 해당 구간만 읽음"""
+        return self._query(
+            "SELECT id, date, type, category, description, amount FROM transactions "
+            "WHERE username = ? AND date BETWEEN ? AND ? ORDER BY date, id",
+            (username, _day(start).strftime(DATE_FMT), _day(end).strftime(DATE_FMT)))
+
+    def _append_row(self, username: str, row: Dict):
+        self._append_rows(username, [row])
+
+    def _append_rows(self, username: str, rows: List[Dict]):
+        """여러 건을 한 트랜잭션으로 추가"""
+        values = [self._values(username, r) for r in rows]
+        with self._lock, self._conn:
+            self._conn.executemany(_INSERT, values)
+            self._cache.pop(username, None)
+
+    def _append_frame(self, username: str, df: pd.DataFrame):
+        """DataFrame 열에서 바로 값 튜플을 만들어 한 트랜잭션으로 추가"""
+        values = zip(df["id"].tolist(), [username] * len(df), df["date"].dt.strftime(DATE_FMT).tolist(),
+                     df["type"].astype(str).tolist(), df["category"].astype(str).tolist(),
+                     df["description"].astype(str).tolist(), df["amount"].tolist())
+        with self._lock, self._conn:
+            self._conn.executemany(_INSERT, values)
+            self._cache.pop(username, None)
+
+    def _delete_ids(self, username: str, ids: set) -> pd.DataFrame:
+        """id(기본 키)로 바로 찾아 지움 (많이 고르면 _ID_CHUNK 개씩 나눠 조회)"""
+        ids = sorted(ids)
+        with self._lock, self._conn:
+            removed = _concat([
+                self._query(
+                    "SELECT id, date, type, category, description, amount FROM transactions "
+                    f"WHERE username = ? AND id IN ({','.join('?' * len(chunk))})", [username] + chunk)
+                for chunk in (ids[i:i + _ID_CHUNK] for i in range(0, len(ids), _ID_CHUNK))
+            ])
+            self._conn.executemany(
+                "DELETE FROM transactions WHERE username = ? AND id = ?", [(username, i) for i in ids])
+            self._cache.pop(username, None)
+        return removed
+
+    def _overwrite(self, username: str, df: pd.DataFrame):
+        """지우기와 다시 넣기를 한 트랜잭션으로 (넣다가 실패하면 이전 거래가 그대로 남음)"""
+        values = [self._values(username, r) for r in df.to_dict("records")]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM transactions WHERE username = ?", (username,))
+            self._conn.executemany(_INSERT, values)
+            self._cache.pop(username, None)
+
+    def evict(self, username: str):
+        with self._lock:
+            self._cache.pop(username, None)
+
+
+# -------------------------------
+# CSV -> SQLite 이전
+# -------------------------------
+def migrate_csv(username: str, backend: Optional[SqliteBackend] = None) -> Tuple[int, List[int]]:
+    """
+    transactions_<user>.csv 의 거래를 SQLite로 옮김 (CSV 파일은 그대로 둠).
+    - 이미 SQLite에 그 사용자의 거래가 있으면 중복을 막기 위해 ValueError
+    - id 는 모든 사용자 공통 기본 키: 다른 사용자가 이미 쓰는 id 는 새 id 로 바꿔 넣음
+    - (옮긴 건수, 바꾼 원래 id 목록) 반환, 형식 오류로 제외된 행은 storage.load_errors 로 확인
+    """
+    backend = backend or SqliteBackend()
+    if not backend.read_all(username).empty:
+        raise ValueError(f"'{username}' 거래가 이미 SQLite에 있습니다.")
+    df = storage.read_all(storage.csv_path_for_user(username))
+    taken = backend._taken_ids(df["id"].tolist())
+    if taken:
+        df = df.copy()
+        hit = df["id"].isin(taken)
+        df.loc[hit, "id"] = new_ids(int(hit.sum()))
+    backend._append_rows(username, df.to_dict("records"))
+    # 원장이 바뀌었으므로 월별 집계는 다음 조회 때 새 저장소에서 다시 만듦
+    backend._changed(username)
+    return len(df), sorted(taken)
+
+
+def _main(argv: List[str]) -> int:
+    if not argv:
+        print("사용법: python -m services.sqlite_backend <username> [...]")
+        return 2
+    backend = SqliteBackend()
+    status = 0
+    for username in argv:
+        path = storage.csv_path_for_user(username)
+        if not path.exists():
+            print(f"{username}: {path.name} 없음, 건너뜀")
+            continue
+        try:
+            n, reassigned = migrate_csv(username, backend)
+        except ValueError as e:
+            print(f"{username}: {e}")
+            continue
+        except sqlite3.IntegrityError as e:
+            # 한 사용자가 실패해도 나머지 사용자는 계속 옮김 (이 사용자 분은 트랜잭션이 되돌려짐)
+            print(f"{username}: 이전 실패 ({e}), 건너뜀")
+            status = 1
+            continue
+        skipped = storage.load_errors(path)
+        print(f"{username}: {n}건 이전" + (f" (형식 오류 {len(skipped)}건 제외)" if skipped else ""))
+        if reassigned:
+            shown = ", ".join(map(str, reassigned[:10])) + (" ..." if len(reassigned) > 10 else "")
+            print(f"  다른 사용자와 겹친 id {len(reassigned)}건은 새 id 로 저장: {shown}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
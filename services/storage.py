@@ -1,7 +1,28 @@
+import csv
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict
-from app.config import DATA_DIR
+from typing import Dict, List, Optional, Tuple
+from app.config import DATA_DIR, DATE_FMT, TYPES, CATEGORIES, STORAGE_BACKEND
+from models.transaction import ERR_AMOUNT, ERR_DATE, ERR_TYPE, ERROR_LABELS, check_batch, new_id, new_ids
+
+COLUMNS = ["id", "date", "type", "category", "description", "amount"]
+HEADER = ",".join(COLUMNS)
+
+# 파싱된 CSV 캐시: 경로 -> (파일 스탬프, DataFrame, 읽지 못한 행 목록)
+# - 스탬프는 (mtime_ns, size) 이며 외부에서 파일이 바뀌면 다시 읽음
+# - 최근에 쓴 파일부터 CACHE_MAX_FILES 개, 합계 CACHE_MAX_ROWS 행까지만 보관 (LRU)
+#   (월별 분할 저장소는 파일이 많고 작으므로 파일 수보다 행 수로 제한)
+CACHE_MAX_FILES = 256
+CACHE_MAX_ROWS = 2_000_000
+_cache: "OrderedDict[str, Tuple[Tuple[int, int], pd.DataFrame, List[str]]]" = OrderedDict()
+
+# 화면(메인) 스레드와 작업 스레드가 함께 쓰므로 캐시/파일 접근은 이 잠금 안에서
+# (월별 집계 aggregates 도 같은 잠금 사용 → 잠금 순서 꼬임 없음)
+io_lock = threading.RLock()
 
 def csv_path_for_user(username: str) -> Path:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -9,24 +30,499 @@ def csv_path_for_user(username: str) -> Path:
 
 def _ensure_csv(path: Path):
     if not path.exists():
-        path.write_text("date,type,category,description,amount\n", encoding="utf-8")
+        path.write_text(HEADER + "\n", encoding="utf-8")
+
+def _has_current_header(path: Path) -> bool:
+    """첫 줄이 현재 컬럼 순서(id 포함)로 시작하는지"""
+    with open(path, encoding="utf-8", newline="") as f:
+        first = f.readline().lstrip("\ufeff").rstrip("\r\n")
+    return first == HEADER or first.startswith(HEADER + ",")
+
+def _ends_with_newline(path: Path) -> bool:
+    """파일 마지막 바이트가 줄바꿈인지 (빈 파일이면 True)"""
+    with open(path, "rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+# ---------- 타입 변환 ----------
+def _category_levels(values: pd.Series) -> List[str]:
+    """설정의 카테고리 + 파일에만 있는 카테고리(손실 방지)"""
+    extra = sorted(set(values.unique()) - set(CATEGORIES))
+    return CATEGORIES + extra
+
+def _with_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """type/category 컬럼을 Categorical로 맞춤"""
+    df["type"] = pd.Categorical(df["type"].astype(str), categories=TYPES)
+    cat = df["category"].astype(str)
+    df["category"] = pd.Categorical(cat, categories=_category_levels(cat))
+    return df
+
+def _empty_frame() -> pd.DataFrame:
+    df = pd.DataFrame({
+        "id": pd.Series(dtype="int64"),
+        "date": pd.Series(dtype="datetime64[ns]"),
+        "type": pd.Series(dtype=str),
+        "category": pd.Series(dtype=str),
+        "description": pd.Series(dtype=str),
+        "amount": pd.Series(dtype="int64"),
+    })
+    return _with_categories(df)
+
+def _coerce(raw: pd.DataFrame, first_line: int = 2) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    문자열 DataFrame -> 타입이 지정된 DataFrame
+    - id/amount: int64, date: datetime64, type/category: Categorical
+    - 형식이 잘못된 행은 제외하고 '줄 번호: 사유' 목록으로 돌려줌
+    - id 는 _fill_ids 로 미리 채워져 있어야 함
+    """
+    if "id" not in raw.columns:
+        _fill_ids(raw)
+    for c in COLUMNS:
+        if c not in raw.columns:
+            raw[c] = ""
+    raw = raw[COLUMNS].fillna("")
+    if raw.empty:
+        return _empty_frame(), []
+
+    # 검사 규칙은 Transaction.validate 와 같은 check_batch 사용
+    dates, amounts, codes = check_batch(raw["date"], raw["type"], raw["amount"])
+    field_of = {ERR_DATE: "date", ERR_TYPE: "type", ERR_AMOUNT: "amount"}
+
+    errors = []
+    for pos in codes.nonzero()[0]:
+        reasons = [f"{ERROR_LABELS[bit]} '{raw[f].iat[pos]}'" for bit, f in field_of.items() if codes[pos] & bit]
+        errors.append(f"{first_line + pos}행: " + ", ".join(reasons))
+
+    keep = codes == 0
+    df = pd.DataFrame({
+        "id": raw["id"][keep].astype("int64"),
+        "date": dates[keep],
+        "type": raw["type"][keep],
+        "category": raw["category"][keep],
+        "description": raw["description"][keep],
+        "amount": amounts[keep].astype("int64"),
+    }).reset_index(drop=True)
+    return _with_categories(df), errors
+
+def _concat(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """타입 유지하며 이어붙임 (카테고리 목록이 다르면 다시 맞춤)"""
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return _empty_frame()
+    out = pd.concat(frames, ignore_index=True)
+    if not all(isinstance(out[c].dtype, pd.CategoricalDtype) for c in ("type", "category")):
+        out = _with_categories(out)
+    return out
+
+# ---------- 날짜순 유지 ----------
+# 메모리의 원장 DataFrame 은 항상 날짜순(같은 날짜는 기록 순서) → 기간 조회는 이진 탐색으로 잘라냄
+# (파일은 덧붙이기 전용 그대로: 한 건 추가가 파일 전체를 다시 쓰지 않도록)
+def _sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """날짜순이 아니면 안정 정렬 (이미 정렬돼 있으면 그대로)"""
+    if df["date"].is_monotonic_increasing:
+        return df
+    order = np.argsort(df["date"].to_numpy(), kind="stable")
+    return df.iloc[order].reset_index(drop=True)
+
+def _merge_sorted(df: pd.DataFrame, added: pd.DataFrame) -> pd.DataFrame:
+    """
+    날짜순 df 에 added 를 합쳐 날짜순 유지
+    - 보통은 added 가 모두 마지막 날짜 이후라 뒤에 붙이기만 함
+    - 아니면 두 정렬된 묶음의 안정 병합 (같은 날짜는 기존 행이 앞)
+    """
+    added = _sort_by_date(added)
+    if df.empty or added.empty or added["date"].iat[0] >= df["date"].iat[-1]:
+        return _concat([df, added])
+    # 모두 같은 자리에 들어가면(한 건 추가 등) 그 자리에 끼워 넣기만 함
+    lo, hi = df["date"].searchsorted([added["date"].iat[0], added["date"].iat[-1]], side="right")
+    if lo == hi:
+        return _concat([df.iloc[:lo], added, df.iloc[lo:]])
+    return _sort_by_date(_concat([df, added]))
+
+def slice_dates(df: pd.DataFrame, start, end) -> pd.DataFrame:
+    """날짜순 df 에서 start ~ end (양 끝 포함) 행 묶음 (이진 탐색, 복사 없는 잘라내기)"""
+    dates = df["date"]
+    lo = dates.searchsorted(_day(start), side="left")
+    hi = dates.searchsorted(_day(end), side="right")
+    return df.iloc[lo:max(lo, hi)]
+
+def _fill_ids(raw: pd.DataFrame) -> bool:
+    """
+    문자열 DataFrame의 id 컬럼을 채움 (없으면 추가, 빈 값/숫자가 아닌 값은 새 id).
+    - 같은 id 가 여러 줄이면(손으로 복사한 줄, 백업 병합 등) 첫 줄만 두고 나머지는 새 id
+      (표의 행 키, 삭제 대상이 id 하나에 한 줄이어야 함)
+    - 바꾼 것이 있으면 True (파일에 다시 써야 함)
+    """
+    if "id" not in raw.columns:
+        raw.insert(0, "id", "")
+    ids = raw["id"]
+    try:
+        number = ids.astype("int64")  # 보통은 모두 정수 문자열: 빠른 경로
+        valid = number >= 0
+    except (ValueError, TypeError, OverflowError):
+        valid = ids.str.fullmatch(r"\d+").fillna(False).astype(bool)
+        number = ids.str.lstrip("0").replace("", "0")  # 앞자리 0 이 붙은 id 도 같은 값으로
+    missing = ~valid
+    missing[valid] = number[valid].duplicated()
+    if not missing.any():
+        return False
+    raw.loc[missing, "id"] = [str(i) for i in new_ids(int(missing.sum()))]
+    return True
+
+# ---------- 캐시 ----------
+def _stamp(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+def _cache_put(path: Path, df: pd.DataFrame, errors: List[str]):
+    key = str(path)
+    _cache[key] = (_stamp(path), df, errors)
+    _cache.move_to_end(key)
+    rows = sum(len(entry[1]) for entry in _cache.values())
+    while len(_cache) > 1 and (len(_cache) > CACHE_MAX_FILES or rows > CACHE_MAX_ROWS):
+        _, (_, old, _) = _cache.popitem(last=False)
+        rows -= len(old)
+
+def _fresh_cached(path: Path):
+    """캐시가 현재 파일과 일치하면 캐시 항목, 아니면 None"""
+    hit = _cache.get(str(path))
+    if hit is not None and hit[0] == _stamp(path):
+        return hit
+    return None
+
+def evict(path: Path):
+    """해당 파일의 캐시 제거 (로그아웃 등)"""
+    with io_lock:
+        _cache.pop(str(path), None)
+
+def clear_cache():
+    with io_lock:
+        _cache.clear()
+
+# ---------- 읽기/쓰기 ----------
+def _load(path: Path):
+    with io_lock:
+        _ensure_csv(path)
+        hit = _fresh_cached(path)
+        if hit is not None:
+            _cache.move_to_end(str(path))
+            return hit
+        raw = pd.read_csv(path, dtype=str, keep_default_na=False)
+        if _fill_ids(raw) or not _has_current_header(path):
+            # id 가 없던 파일(이전 형식): id 를 매겨 한 번만 다시 씀 (형식 오류 행도 그대로 보존)
+            extra = [c for c in raw.columns if c not in COLUMNS]
+            raw.reindex(columns=COLUMNS + extra, fill_value="").to_csv(path, index=False, encoding="utf-8")
+        df, errors = _coerce(raw)
+        _cache_put(path, _sort_by_date(df), errors)
+        return _cache[str(path)]
 
 def read_all(path: Path) -> pd.DataFrame:
-    _ensure_csv(path)
-    return pd.read_csv(path, dtype=str).fillna("")
+    """
+    사용자 CSV 전체를 타입이 지정된 DataFrame으로 반환.
+    - date: datetime64, amount: int64, type/category: Categorical
+    - 형식이 잘못된 행은 제외됨 (load_errors 로 확인)
+    - 날짜순 (같은 날짜는 기록 순서)
+    - 파일이 바뀌지 않았으면 캐시된 DataFrame을 그대로 돌려줌 (호출측에서 수정 금지)
+    """
+    return _load(path)[1]
+
+def load_errors(path: Path) -> List[str]:
+    """마지막으로 읽을 때 제외된 행들의 '줄 번호: 사유' 목록"""
+    return list(_load(path)[2])
+
+def _row_values(row: Dict) -> List[str]:
+    """dict 한 건 -> CSV 한 줄 값 (id 가 없으면 새로 매김, 날짜가 date/Timestamp면 YYYY-MM-DD 로)"""
+    date = row.get("date", "")
+    if not isinstance(date, str):
+        date = pd.Timestamp(date).strftime(DATE_FMT)
+    return [
+        str(int(row.get("id") or new_id())),
+        date,
+        str(row.get("type", "")),
+        str(row.get("category", "")),
+        str(row.get("description", "") or ""),
+        str(row.get("amount", "0")),
+    ]
+
+def frame_from_rows(rows: List[Dict]) -> pd.DataFrame:
+    """dict 목록 -> read_all 과 같은 타입의 DataFrame (형식이 틀린 행은 제외)"""
+    raw = pd.DataFrame([_row_values(r) for r in rows], columns=COLUMNS)
+    return _coerce(raw)[0]
 
 def append_row(row: Dict, path: Path):
-    df = read_all(path)
-    # 타입 맞춤
-    row = {
-        "date": row.get("date", ""),
-        "type": row.get("type", ""),
-        "category": row.get("category", ""),
-        "description": row.get("description", ""),
-        "amount": str(row.get("amount", "0")),
-    }
-    df.loc[len(df)] = row
-    df.to_csv(path, index=False, encoding="utf-8")
+    """
+    한 줄만 파일 끝에 덧붙임.
+    - 기존 내용은 다시 읽거나 쓰지 않음 (기록 건수와 무관하게 일정한 비용)
+    - 파일이 없으면 헤더부터 생성, id 없는 이전 형식이면 먼저 id 를 매김
+    """
+    with io_lock:
+        _ensure_csv(path)
+        if not _has_current_header(path):
+            _load(path)
+        values = _row_values(row)
+        hit = _fresh_cached(path)
+        needs_newline = not _ends_with_newline(path)
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            if needs_newline:
+                f.write("\n")
+            csv.writer(f, lineterminator="\n").writerow(values)
+
+        # 캐시가 최신이었다면 다시 파싱하지 않고 메모리에서 날짜 위치에 한 줄만 끼워 넣음
+        if hit is not None:
+            _, cached, errors = hit
+            added, bad = _coerce(pd.DataFrame([values], columns=COLUMNS), len(cached) + len(errors) + 2)
+            _cache_put(path, _merge_sorted(cached, added), errors + bad)
+        else:
+            evict(path)
+
+def append_frame(df: pd.DataFrame, path: Path):
+    """
+    read_all 형식 DataFrame 을 파일 끝에 한 번에 덧붙임 (대량 가져오기용).
+    - append_row 처럼 기존 내용은 다시 읽거나 쓰지 않음 (한 번 열고 한 번 씀)
+    """
+    with io_lock:
+        _ensure_csv(path)
+        if not _has_current_header(path):
+            _load(path)
+        df = df.reindex(columns=COLUMNS)
+        hit = _fresh_cached(path)
+        needs_newline = not _ends_with_newline(path)
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            if needs_newline:
+                f.write("\n")
+            df.to_csv(f, header=False, index=False, date_format=DATE_FMT, lineterminator="\n")
+
+        if hit is not None:
+            _, cached, errors = hit
+            _cache_put(path, _merge_sorted(cached, df), errors)
+        else:
+            evict(path)
 
 def overwrite(df: pd.DataFrame, path: Path):
-    df.to_csv(path, index=False, encoding="utf-8")
+    with io_lock:
+        df.reindex(columns=COLUMNS).to_csv(path, index=False, encoding="utf-8", date_format=DATE_FMT)
+        evict(path)
+
+def _error_line(error: str) -> int:
+    """'N행: 사유' -> N"""
+    return int(error.split("행", 1)[0])
+
+def delete_ids(ids, path: Path) -> pd.DataFrame:
+    """
+    id 목록의 거래를 파일에서 지우고 지운 행들을 반환.
+    - 파일은 문자열 그대로 다시 읽어 해당 id 줄만 빼고 씀 (형식 오류 행/추가 컬럼도 보존)
+    - 임시 파일에 쓴 뒤 os.replace 로 교체 (중간에 끊겨도 반쪽 파일이 남지 않음)
+    - 남은 행은 그대로 캐시에 넣어 다시 파싱하지 않음 (형식 오류 목록은 줄 번호만 당김)
+    """
+    with io_lock:
+        _, df, errors = _load(path)
+        wanted = {str(int(i)) for i in ids}
+        raw = pd.read_csv(path, dtype=str, keep_default_na=False)
+        # 앞자리 0 이 붙은 id 도 같은 값으로 비교
+        gone = raw["id"].str.lstrip("0").replace("", "0").isin(wanted).to_numpy()
+        if not gone.any():
+            return df.iloc[0:0]
+        tmp = path.with_name(path.name + ".tmp")
+        raw[~gone].to_csv(tmp, index=False, encoding="utf-8")
+        os.replace(tmp, path)
+
+        hit = df["id"].isin([int(i) for i in wanted])
+        gone_lines = np.flatnonzero(gone) + 2
+        kept_errors = []
+        for error in errors:
+            line = _error_line(error)
+            shift = int(np.searchsorted(gone_lines, line))
+            if shift < len(gone_lines) and gone_lines[shift] == line:
+                continue  # 지운 줄
+            kept_errors.append(f"{line - shift}행:" + error.split(":", 1)[1])
+        _cache_put(path, df[~hit].reset_index(drop=True), kept_errors)
+        return df[hit]
+
+# ---------- 저장소 백엔드 ----------
+def _day(value) -> pd.Timestamp:
+    """'YYYY-MM-DD' 문자열/date/datetime -> 자정 Timestamp"""
+    return pd.Timestamp(value).normalize()
+
+def month_bounds(year_month: str) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """'YYYY-MM' -> (그 달 1일, 말일). 형식이 틀리면 ValueError"""
+    period = pd.Period(year_month, freq="M")
+    return period.start_time, period.end_time.normalize()
+
+class StorageBackend:
+    """
+    사용자별 거래 저장소 인터페이스 (username 기준).
+    - read_all/read_range/slice_dates 는 read_all(path)와 같은 타입의 날짜순 DataFrame 반환 (수정 금지)
+    - 거래는 id 컬럼으로 구분하며 추가 시 id 가 없으면 새로 매김
+    - 화면 코드는 get_backend() 로 얻은 객체만 사용
+    """
+    name = ""
+
+    def read_all(self, username: str) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def read_range(self, username: str, start, end) -> pd.DataFrame:
+        """start ~ end (양 끝 포함) 날짜의 거래"""
+        return self.slice_dates(username, start, end)
+
+    def slice_dates(self, username: str, start, end) -> pd.DataFrame:
+        """
+        start ~ end (양 끝 포함) 날짜의 거래를 날짜순으로
+        - 기본 구현: 날짜순 read_all 결과에서 이진 탐색으로 연속 구간만 잘라냄 (O(log n + k))
+        """
+        return slice_dates(self.read_all(username), start, end)
+
+    def read_month(self, username: str, year_month: str) -> pd.DataFrame:
+        """'YYYY-MM' 한 달의 거래 (형식이 틀린 월이면 빈 DataFrame)"""
+        try:
+            start, end = month_bounds(year_month)
+        except (ValueError, TypeError):
+            return _empty_frame()
+        return self.read_range(username, start, end)
+
+    def ledger_stamp(self, username: str):
+        """
+        원장이 바뀌면 달라지는 값 (다른 프로그램이 고친 경우, 백업을 되돌린 경우 포함)
+        - 월별 집계 등 원장에서 만든 캐시가 최신인지 확인하는 데 사용 (repr 로 저장 가능해야 함)
+        """
+        raise NotImplementedError
+
+    def append_row(self, username: str, row: Dict) -> int:
+        """한 건 추가 후 id 반환 (월별 집계도 함께 갱신)"""
+        with io_lock:
+            row = dict(row, id=int(row.get("id") or new_id()))
+            before = self.ledger_stamp(username)
+            self._append_row(username, row)
+            self._changed(username, before, added=frame_from_rows([row]))
+            return row["id"]
+
+    def append_rows(self, username: str, rows: List[Dict]) -> int:
+        """여러 건 추가, 추가한 건수 반환"""
+        with io_lock:
+            rows = [dict(r, id=int(r.get("id") or new_id())) for r in rows]
+            before = self.ledger_stamp(username)
+            self._append_rows(username, rows)
+            self._changed(username, before, added=frame_from_rows(rows))
+            return len(rows)
+
+    def append_frame(self, username: str, df: pd.DataFrame) -> int:
+        """
+        read_all 형식 DataFrame 을 한 번의 쓰기로 추가, 추가한 건수 반환 (대량 가져오기용)
+        - id 가 없거나 비어 있으면 새로 매김
+        """
+        if df.empty:
+            return 0
+        df = df.reindex(columns=COLUMNS).reset_index(drop=True)
+        # id 열이 없거나 비어 있으면 float(NaN) 열이 되므로, 정수 배열에 따로 채움 (큰 id 의 정밀도 손실 방지)
+        missing = df["id"].isna().to_numpy()
+        if missing.any():
+            ids = np.empty(len(df), dtype="int64")
+            ids[~missing] = df["id"][~missing].astype("int64")
+            ids[missing] = new_ids(int(missing.sum()))
+            df["id"] = ids
+        else:
+            df["id"] = df["id"].astype("int64")
+        with io_lock:
+            before = self.ledger_stamp(username)
+            self._append_frame(username, df)
+            self._changed(username, before, added=df)
+        return len(df)
+
+    def delete_ids(self, username: str, ids) -> int:
+        """id 목록의 거래 삭제, 삭제한 건수 반환 (월별 집계도 함께 갱신)"""
+        with io_lock:
+            before = self.ledger_stamp(username)
+            removed = self._delete_ids(username, {int(i) for i in ids})
+            if len(removed):
+                self._changed(username, before, removed=removed)
+            return len(removed)
+
+    def overwrite(self, username: str, df: pd.DataFrame):
+        """전체를 df 로 교체 (월별 집계는 다시 계산)"""
+        with io_lock:
+            self._overwrite(username, df)
+            self._changed(username)
+
+    def load_errors(self, username: str) -> List[str]:
+        """읽을 때 제외된 행 목록 (해당 없으면 빈 목록)"""
+        return []
+
+    def evict(self, username: str):
+        """메모리 캐시 정리 (로그아웃 등)"""
+
+    # ---------- 구현체가 채우는 부분 ----------
+    def _append_row(self, username: str, row: Dict):
+        raise NotImplementedError
+
+    def _append_rows(self, username: str, rows: List[Dict]):
+        for row in rows:
+            self._append_row(username, row)
+
+    def _append_frame(self, username: str, df: pd.DataFrame):
+        self._append_rows(username, df.to_dict("records"))
+
+    def _delete_ids(self, username: str, ids: set) -> pd.DataFrame:
+        """지운 행들을 read_all 형식으로 반환"""
+        raise NotImplementedError
+
+    def _overwrite(self, username: str, df: pd.DataFrame):
+        raise NotImplementedError
+
+    def _changed(self, username: str, before=None, added: Optional[pd.DataFrame] = None,
+                 removed: Optional[pd.DataFrame] = None):
+        """
+        쓰기 후처리. added/removed 가 모두 None 이면 전체가 바뀐 것으로 봄
+        - before: 쓰기 직전의 ledger_stamp (캐시가 그 시점 원장과 맞을 때만 변경분을 더하고 뺌)
+        """
+        from services import aggregates, analytics, range_index
+        aggregates.on_write(username, added=added, removed=removed, before=before)
+        range_index.on_write(username, added=added, removed=removed, before=before)
+        analytics.on_write(username)
+
+class CsvBackend(StorageBackend):
+    """data/transactions_<user>.csv 한 파일에 저장 (위 모듈 함수 사용)"""
+    name = "csv"
+
+    def read_all(self, username: str) -> pd.DataFrame:
+        return read_all(csv_path_for_user(username))
+
+    def ledger_stamp(self, username: str):
+        path = csv_path_for_user(username)
+        return _stamp(path) if path.exists() else None
+
+    def _append_row(self, username: str, row: Dict):
+        append_row(row, csv_path_for_user(username))
+
+    def _append_frame(self, username: str, df: pd.DataFrame):
+        append_frame(df, csv_path_for_user(username))
+
+    def _delete_ids(self, username: str, ids: set) -> pd.DataFrame:
+        return delete_ids(ids, csv_path_for_user(username))
+
+    def _overwrite(self, username: str, df: pd.DataFrame):
+        overwrite(df, csv_path_for_user(username))
+
+    def load_errors(self, username: str) -> List[str]:
+        return load_errors(csv_path_for_user(username))
+
+    def evict(self, username: str):
+        evict(csv_path_for_user(username))
+
+_backend: Optional[StorageBackend] = None
+
+def get_backend() -> StorageBackend:
+    """설정(STORAGE_BACKEND)에 맞는 저장소 객체 (프로세스당 하나)"""
+    global _backend
+    if _backend is None:
+        if STORAGE_BACKEND == "partitioned":
+            from services.partitioned_backend import PartitionedCsvBackend
+            _backend = PartitionedCsvBackend()
+        elif STORAGE_BACKEND == "sqlite":
+            from services.sqlite_backend import SqliteBackend
+            _backend = SqliteBackend()
+        elif STORAGE_BACKEND == "csv":
+            _backend = CsvBackend()
+        else:
+            raise ValueError(f"알 수 없는 저장소: {STORAGE_BACKEND}")
+    return _backend
@@ -0,0 +1,29 @@
+import pytest
+
+from services import avatars
+from services.auth import _file_name
+
+pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+
+def _stem(username):
+    return _file_name(username)[:-len(".json")]
+
+
+def _upload(tmp_path, username, color):
+    src = tmp_path / f"src_{color}.png"
+    Image.new("RGB", (300, 300), color).save(src)
+    return avatars.save_avatar(src, tmp_path, _stem(username))
+
+
+def test_thumbnail_does_not_collide_with_other_users_avatar(tmp_path):
+    kim = _upload(tmp_path, "kim", "red")
+    other = _upload(tmp_path, "kim_96", "blue")  # 예전 이름 규칙이면 kim 의 96 썸네일과 같은 파일
+
+    thumb = avatars.thumbnail(kim, 96)
+    assert thumb != other
+    with Image.open(thumb) as im:
+        assert im.convert("RGB").getpixel((10, 10)) == (255, 0, 0)
+    with Image.open(other) as im:
+        assert im.convert("RGB").getpixel((10, 10)) == (0, 0, 255)
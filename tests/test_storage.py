@@ -0,0 +1,43 @@
+import pytest
+
+from services import storage
+
+HEADER = "id,date,type,category,description,amount\n"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    storage.clear_cache()
+    yield
+    storage.clear_cache()
+
+
+def test_duplicate_ids_are_reassigned_and_written_back(tmp_path):
+    path = tmp_path / "t.csv"
+    path.write_text(HEADER
+                    + "7,2025-03-01,지출,식비,a,100\n"
+                    + "7,2025-03-02,지출,식비,b,200\n"   # 손으로 복사한 줄
+                    + "8,2025-03-03,수입,급여,c,300\n", encoding="utf-8")
+
+    df = storage.read_all(path)
+    assert df["id"].is_unique
+    assert df.loc[df["description"] == "a", "id"].item() == 7  # 첫 줄은 그대로
+
+    storage.clear_cache()
+    assert storage.read_all(path)["id"].tolist() == df["id"].tolist()  # 파일에도 반영됨
+
+    removed = storage.delete_ids([7], path)
+    assert removed["description"].tolist() == ["a"]
+    assert storage.read_all(path)["description"].tolist() == ["b", "c"]
+
+
+def test_delete_keeps_invalid_rows_and_extra_columns(tmp_path):
+    path = tmp_path / "t.csv"
+    path.write_text("id,date,type,category,description,amount,memo\n"
+                    + "1,2025-03-01,지출,식비,a,100,x\n"
+                    + "2,2025-03-02,지출,식비,b,abc,y\n"
+                    + "3,2025-03-03,수입,급여,c,500,z\n", encoding="utf-8")
+    storage.delete_ids([1], path)
+    assert "abc" in path.read_text(encoding="utf-8")
+    assert path.read_text(encoding="utf-8").splitlines()[0].endswith(",memo")
+    assert storage.load_errors(path) == ["2행: 금액 'abc'"]
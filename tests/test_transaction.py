@@ -0,0 +1,19 @@
+import pandas as pd
+
+from models.transaction import ERR_AMOUNT, validate_batch
+
+
+def _batch(amounts):
+    n = len(amounts)
+    return {"date": ["2025-03-01"] * n, "type": ["지출"] * n, "amount": amounts}
+
+
+def test_fractional_amount_in_object_column_is_rejected():
+    ok, codes = validate_batch(_batch(pd.Series([1000, 1.5], dtype=object)))
+    assert ok.tolist() == [True, False]
+    assert codes[1] & ERR_AMOUNT
+
+
+def test_large_amounts_are_exact_or_rejected():
+    ok, codes = validate_batch(_batch(pd.Series(["9007199254740993", "100000000000000000000000", "abc"])))
+    assert ok.tolist() == [True, False, False]
@@ -0,0 +1,54 @@
+"""
+analytics 벤치마크: 부호 금액 계산(행 단위 apply vs 벡터 연산)
+실행: python -m tools.bench_analytics [행수 ...]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.config import CATEGORIES, TYPES
+from services import analytics
+
+
+def make_ledger(n: int, seed: int = 0) -> pd.DataFrame:
+    """read_all 과 같은 타입의 임의 가계부 n건 (최근 약 10년)"""
+    rng = np.random.default_rng(seed)
+    days = rng.integers(0, 3650, n)
+    df = pd.DataFrame({
+        "date": pd.Timestamp("2016-01-01") + pd.to_timedelta(days, unit="D"),
+        "type": pd.Categorical.from_codes(rng.integers(0, 2, n), categories=TYPES),
+        "category": pd.Categorical.from_codes(rng.integers(0, len(CATEGORIES), n), categories=CATEGORIES),
+        "description": "bench",
+        "amount": rng.integers(100, 1_000_000, n).astype("int64"),
+    })
+    return df.sort_values("date", kind="stable").reset_index(drop=True)
+
+
+def _timeit(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _signed_apply(df: pd.DataFrame) -> pd.Series:
+    """이전 구현 (비교용)"""
+    return df.apply(lambda r: r["amount"] if r["type"] == "수입" else -r["amount"], axis=1)
+
+
+def run(sizes):
+    print(f"{'rows':>10} {'apply(s)':>10} {'vector(s)':>10} {'speedup':>9}")
+    for n in sizes:
+        df = make_ledger(n)
+        assert (_signed_apply(df.head(1000)) == analytics.signed_amount(df.head(1000))).all()
+        t_old = _timeit(lambda: _signed_apply(df), repeat=1)
+        t_new = _timeit(lambda: analytics.signed_amount(df))
+        print(f"{n:>10,} {t_old:>10.3f} {t_new:>10.4f} {t_old / t_new:>8.0f}x")
+
+
+if __name__ == "__main__":
+    run([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,81 @@
+"""
+AuthService 벤치마크: 사용자 수에 따른 로그인/가입 지연
+실행: python -m tools.bench_auth [사용자수 ...]
+- 현재 구현(사용자별 파일 + 메모리 색인)과 이전 방식(users.json 전체 읽기/쓰기)을 비교
+- 임시 폴더에서만 실행 (data/ 는 건드리지 않음)
+- 저장소 비용만 보려고 비밀번호 해시 비용은 최소(pbkdf2 1회)로 낮춰서 측정
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from services import auth
+from services.auth import AuthService, User
+
+PASSWORD = "bench-pw"
+
+
+def _records(n: int, pw_hash: str):
+    return {f"user{i}": User(f"user{i}", f"사용자{i}", pw_hash).to_dict() for i in range(n)}
+
+
+def _median_ms(fn, repeat: int) -> float:
+    times = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        fn(i)
+        times.append(time.perf_counter() - t0)
+    times.sort()
+    return times[len(times) // 2] * 1000
+
+
+def _legacy(tmp: Path, db, repeat: int):
+    """이전 방식 (비교용): 매 요청마다 users.json 전체를 읽고, 가입 때 전체를 다시 씀"""
+    path = tmp / "users.json"
+    path.write_text(json.dumps(db, ensure_ascii=False, indent=2), encoding="utf-8")
+    pw_hash = AuthService._hash(PASSWORD)
+
+    def login(i):
+        rec = json.loads(path.read_text(encoding="utf-8")).get(f"user{i}")
+        assert rec and auth.verify_password(PASSWORD, rec["password_hash"])
+
+    def register(i):
+        all_ = json.loads(path.read_text(encoding="utf-8"))
+        all_[f"new{i}"] = User(f"new{i}", "new", pw_hash).to_dict()
+        path.write_text(json.dumps(all_, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    return _median_ms(login, repeat), _median_ms(register, repeat)
+
+
+def _current(tmp: Path, db, repeat: int):
+    svc = AuthService(users_dir=tmp / "users")
+    svc.users_dir.mkdir(parents=True, exist_ok=True)
+    for rec in db.values():
+        svc._write_json(svc._path(rec["username"]), rec)
+
+    def login(i):
+        assert svc.login(f"user{i}", PASSWORD)
+
+    def register(i):
+        assert svc.register(f"new{i}", PASSWORD, "new")
+
+    return _median_ms(login, repeat), _median_ms(register, repeat)
+
+
+def run(sizes, repeat: int = 50):
+    auth.PASSWORD_SCHEME = "pbkdf2_sha256"
+    auth.PASSWORD_COST["pbkdf2_sha256"] = 1
+    print(f"{'users':>9} {'login old(ms)':>14} {'login new(ms)':>14} {'register old(ms)':>17} {'register new(ms)':>17}")
+    for n in sizes:
+        db = _records(n, AuthService._hash(PASSWORD))
+        with tempfile.TemporaryDirectory() as d:
+            old_login, old_reg = _legacy(Path(d), db, min(repeat, 10))
+        with tempfile.TemporaryDirectory() as d:
+            new_login, new_reg = _current(Path(d), db, repeat)
+        print(f"{n:>9,} {old_login:>14.2f} {new_login:>14.3f} {old_reg:>17.2f} {new_reg:>17.3f}")
+
+
+if __name__ == "__main__":
+    run([int(a) for a in sys.argv[1:]] or [10_000, 100_000])
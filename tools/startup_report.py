@@ -0,0 +1,80 @@
+"""
+시작 시간 보고: 로그인 화면이 뜰 때까지 걸린 시간과 import 비용 상위 목록
+실행: python -m tools.startup_report [상위 개수]
+- import 비용은 `python -X importtime` 결과(누적, 마이크로초)를 모듈별로 정리
+- 로그인 화면 전에 pandas/matplotlib 이 import 되면 경고 (지연 import 회귀)
+- 화면(DISPLAY)이 없으면 창 생성은 건너뛰고 import 비용만 보고
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ("pandas", "numpy", "matplotlib")
+
+# 새 프로세스에서 App 생성 -> 첫 화면 그리기(update)까지 시간 측정
+_PROBE = """
+import sys, time
+t0 = time.perf_counter()
+from app.app import App
+t_import = time.perf_counter() - t0
+try:
+    app = App()
+except Exception as e:  # tkinter.TclError: 화면 없음
+    print("no-display", t_import, repr(e))
+    raise SystemExit(0)
+# 미리 import(_warm_up)는 첫 화면 뒤에 시작되므로 그 전에 확인
+heavy = sorted({{m.split(".")[0] for m in sys.modules}} & {heavy!r})
+app.update()
+t_login = time.perf_counter() - t0
+app.destroy()
+print("ok", t_import, t_login, ",".join(heavy))
+"""
+
+
+def _run(args, code: str):
+    return subprocess.run([sys.executable, *args, "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, encoding="utf-8")
+
+
+def import_costs(top: int):
+    """로그인 화면에 필요한 import(app.app, ui.login)의 모듈별 누적 import 시간(ms) 상위 top 개와 전체 합계"""
+    proc = _run(["-X", "importtime"], "import app.app, ui.login")
+    rows = []
+    for line in proc.stderr.splitlines():
+        # 'import time:   self [us] | cumulative | imported package'
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cum, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cum) / 1000, int(own) / 1000, name.strip()))
+    total = sum(r[1] for r in rows)
+    rows.sort(reverse=True)
+    return rows[:top], total
+
+
+def main(argv) -> int:
+    top = int(argv[0]) if argv else 15
+
+    rows, total_ms = import_costs(top)
+    print(f"import app.app, ui.login: 합계 {total_ms:.1f} ms (모듈 자체 시간 합)")
+    print(f"{'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+    for cum, own, name in rows:
+        print(f"{cum:>10.1f} {own:>10.1f}  {name}")
+
+    proc = _run([], _PROBE.format(heavy=set(HEAVY)))
+    fields = (proc.stdout.strip().splitlines() or ["error"])[-1].split(" ", 3)
+    if fields[0] == "ok":
+        _, t_import, t_login, heavy = fields + [""] * (4 - len(fields))
+        print(f"\n로그인 화면까지: {float(t_login) * 1000:.0f} ms (import {float(t_import) * 1000:.0f} ms)")
+        if heavy:
+            print(f"경고: 로그인 화면 전에 import 됨 -> {heavy}")
+    elif fields[0] == "no-display":
+        print(f"\n화면이 없어 창 생성은 건너뜀 (import {float(fields[1]) * 1000:.0f} ms)")
+    else:
+        print("\n측정 실패:\n" + proc.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from pathlib import Path
+
+from services import avatars
+from services.auth import AVATAR_DIR
+
+# (선택) 아바타 표시를 위한 Pillow
+try:
+    from PIL import Image, ImageTk  # type: ignore
+    HAVE_PIL = True
+except Exception:
+    HAVE_PIL = False
+
+# 디코딩된 아바타 캐시 (프로그램 전체 공용): (경로, mtime_ns, 크기) -> PhotoImage
+# - 파일이 바뀌면 mtime 이 달라져 새로 읽음, 오래된 항목부터 CACHE_MAX 개까지만 보관
+CACHE_MAX = 32
+_cache: "OrderedDict[tuple, object]" = OrderedDict()
+
+
+def avatar_photo(path, size: int):
+    """
+    path 아바타를 size 상자에 맞춘 PhotoImage (Pillow 가 없거나 열 수 없으면 None)
+    - 같은 파일/크기면 다시 디코딩하지 않음
+    - data/avatars 안의 아바타는 미리 만든 썸네일을 읽음 (없으면 이때 만들어 둠)
+    """
+    if not (HAVE_PIL and path):
+        return None
+    src = Path(path)
+    try:
+        key = (str(src), src.stat().st_mtime_ns, size)
+    except OSError:
+        return None
+    hit = _cache.get(key)
+    if hit is not None:
+        _cache.move_to_end(key)
+        return hit
+
+    thumb = avatars.thumbnail(src, size, create=_in_avatar_dir(src))
+    try:
+        im = Image.open(thumb) if thumb is not None else avatars.open_scaled(src, size)
+        photo = ImageTk.PhotoImage(im)
+    except Exception:
+        return None
+    _cache[key] = photo
+    while len(_cache) > CACHE_MAX:
+        _cache.popitem(last=False)
+    return photo
+
+
+def _in_avatar_dir(src: Path) -> bool:
+    # 사용자가 고른 원본 폴더(사진 폴더 등)에는 썸네일 파일을 만들지 않음
+    try:
+        return src.resolve().parent == AVATAR_DIR.resolve()
+    except OSError:
+        return False
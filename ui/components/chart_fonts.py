@@ -0,0 +1,22 @@
+"""
+그래프 한글 폰트 설정 (matplotlib rcParams)
+- Figure 를 만들기 전에 메인 스레드에서 setup() 호출 (글자는 만들 때의 폰트를 계속 씀)
+- 홈 이번달 차트와 ChartPanel(분석 화면) 이 같이 씀, 여러 번 불러도 한 번만 적용
+"""
+import matplotlib as mpl
+
+# ✅ 한글/숫자 깨짐 방지: OS별 한글 폰트 (Windows / macOS / Linux), 없는 폰트는 건너뜀
+KOREAN_FONTS = ["Malgun Gothic", "AppleGothic", "NanumGothic"]
+
+_done = False
+
+
+def setup():
+    global _done
+    if _done:
+        return
+    mpl.rcParams["font.family"] = "sans-serif"
+    rest = [f for f in mpl.rcParams["font.sans-serif"] if f not in KOREAN_FONTS]
+    mpl.rcParams["font.sans-serif"] = KOREAN_FONTS + rest
+    mpl.rcParams["axes.unicode_minus"] = False
+    _done = True
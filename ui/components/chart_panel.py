@@ -0,0 +1,51 @@
+from tkinter import ttk
+from typing import Any, Callable, Dict
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from ui.components import chart_fonts
+
+
+class ChartPanel(ttk.Frame):
+    """
+    Figure/캔버스 하나를 계속 쓰는 그래프 영역.
+    - 종류(kind)마다 Axes 를 하나씩 두고, show() 는 그 Axes 만 보이게 함
+    - 같은 데이터로 종류만 바꾸면 artist 는 그대로 두고 다시 그리기만 함
+    - 데이터가 바뀐 종류만 draw(ax) 로 artist 를 새로 만듦
+    """
+
+    def __init__(self, parent, kinds, *, figsize=(8, 4), dpi=100):
+        super().__init__(parent)
+        chart_fonts.setup()  # 글자를 만들기 전에 (메인 스레드)
+        # pyplot 을 거치지 않음 (figure 관리자에 창이 쌓이지 않음)
+        self.fig = Figure(figsize=figsize, dpi=dpi, layout="tight")
+        self._axes = {}
+        self._drawn: Dict[str, Any] = {}  # kind -> 마지막으로 그린 데이터
+        for kind in kinds:
+            ax = self.fig.add_subplot(label=kind)
+            ax.set_visible(False)
+            self._axes[kind] = ax
+        self._msg = self.fig.text(0.5, 0.5, "", ha="center", va="center")
+
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+    def show(self, kind: str, data, draw: Callable[[Any, Any], None]):
+        """kind 의 Axes 에 data 를 표시 (이미 그 data 로 그렸으면 draw 는 건너뜀)"""
+        ax = self._axes[kind]
+        if self._drawn.get(kind) is not data:
+            ax.clear()
+            draw(ax, data)
+            self._drawn[kind] = data
+        for other in self._axes.values():
+            other.set_visible(other is ax)
+        self._msg.set_text("")
+        self.canvas.draw_idle()
+
+    def message(self, text: str):
+        """그래프 대신 안내 문구만 표시 (불러오는 중/데이터 없음)"""
+        for ax in self._axes.values():
+            ax.set_visible(False)
+        self._msg.set_text(text)
+        self.canvas.draw_idle()
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
 from services.auth import get_current_user, set_current_user
+from services import storage
+from ui.components.avatar import avatar_photo
 
 class TopBar(ttk.Frame):
     def __init__(self, parent, app, *, title="", show_back=False, back_to=None):
@@ -30,6 +32,11 @@ class TopBar(ttk.Frame):
         right = ttk.Frame(self)
         right.grid(row=0, column=2, sticky="e")
 
+        # 작은 아바타 (미리 만든 상단바용 썸네일)
+        self.lbl_avatar = ttk.Label(right)
+        self.lbl_avatar.grid(row=0, column=0, sticky="e", padx=(0, 6))
+        self._avatar_img = None
+
         # 프로필 칩: 고정 글자폭으로 폭 변동 방지 (문자 단위)
         # ttk.Label은 테마에 따라 배경색 적용이 흐릴 수 있어 tk.Label 사용
         self.lbl_user = tk.Label(
@@ -37,10 +44,10 @@ class TopBar(ttk.Frame):
             bg="#eef1ff", fg="#374151"
         )
         self.lbl_user.configure(width=24, anchor="e")  # 💡 폭 고정(24글자), 오른쪽 정렬
-        self.lbl_user.grid(row=0, column=0, sticky="e")
+        self.lbl_user.grid(row=0, column=1, sticky="e")
 
         self.btn_logout = ttk.Button(right, text="로그아웃", command=self._logout)
-        self.btn_logout.grid(row=0, column=1, padx=(8, 0), sticky="e")
+        self.btn_logout.grid(row=0, column=2, padx=(8, 0), sticky="e")
 
         # 하단 구분선(TopBar 내부에!)
         sep = ttk.Separator(self, orient="horizontal")
@@ -57,6 +64,17 @@ class TopBar(ttk.Frame):
             self.lbl_user.config(text=new_text)
             self._last_user_text = new_text
 
+        # 같은 파일이면 캐시된 같은 이미지가 오므로 바뀔 때만 반영
+        img = avatar_photo(u.avatar, 28) if u else None
+        if img is not self._avatar_img:
+            self._avatar_img = img
+            self.lbl_avatar.config(image=img or "")
+
     def _logout(self):
+        u = get_current_user()
+        if u:
+            from services import range_index
+            storage.get_backend().evict(u.username)
+            range_index.drop(u.username)
         set_current_user(None)
         self.app.show("login")
@@ -0,0 +1,151 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Hashable, List, Sequence, Tuple
+
+
+class VirtualTable(ttk.Frame):
+    """
+    행 수와 무관하게 화면에 보이는 만큼만 Treeview 아이템을 만드는 표.
+    - set_source(count, row_fn): row_fn(i) -> (key, values, tags)
+    - key(문자열로 바뀜)는 Treeview iid 로 쓰이며 selection() 이 돌려주는 값
+    - 스크롤바는 전체 행 수 기준으로 동작
+    """
+
+    def __init__(self, parent, *, columns: Sequence[str], headings: Sequence[str],
+                 widths: Sequence[int], anchors: Sequence[str], stretch: str = ""):
+        super().__init__(parent)
+        self._count = 0
+        self._row_fn: Callable[[int], Tuple[Hashable, tuple, tuple]] = lambda i: (i, (), ())
+        self._top = 0            # 맨 위에 보이는 행 번호
+        self._visible = 1        # 한 화면에 보이는 행 수
+        self._selected = set()   # 선택된 key (화면 밖으로 스크롤돼도 유지)
+        self._shown: List[Hashable] = []
+
+        self.tree = ttk.Treeview(self, columns=tuple(columns), show="headings", height=18)
+        for c, label, w, a in zip(columns, headings, widths, anchors):
+            self.tree.heading(c, text=label)
+            self.tree.column(c, width=w, anchor=a, stretch=(c == stretch))
+
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.vsb.pack(side="right", fill="y")
+
+        self.tree.bind("<Configure>", lambda e: self._on_resize())
+        self.tree.bind("<<TreeviewSelect>>", lambda e: self._on_select())
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_units(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_units(3))
+        self.tree.bind("<Up>", lambda e: self._on_key(-1))
+        self.tree.bind("<Down>", lambda e: self._on_key(1))
+        self.tree.bind("<Prior>", lambda e: self._scroll_units(-self._visible))
+        self.tree.bind("<Next>", lambda e: self._scroll_units(self._visible))
+
+    # ---------- Public ----------
+    def tag_configure(self, tag: str, **kw):
+        self.tree.tag_configure(tag, **kw)
+
+    def set_source(self, count: int, row_fn: Callable[[int], Tuple[Hashable, tuple, tuple]],
+                   *, keep_position: bool = False):
+        """전체 행 수와 행 함수 지정 후 다시 그림"""
+        self._count = count
+        self._row_fn = row_fn
+        if not keep_position:
+            self._top = 0
+            self._selected.clear()
+        self._render()
+
+    def refresh(self):
+        """현재 위치에서 다시 그림 (데이터가 바뀐 경우)"""
+        self._render()
+
+    def selection(self) -> List[Hashable]:
+        return list(self._selected)
+
+    def clear_selection(self):
+        self._selected.clear()
+        self._render()
+
+    def see(self, index: int):
+        """index 행이 보이도록 스크롤"""
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + self._visible:
+            self._top = index - self._visible + 1
+        self._render()
+
+    # ---------- 그리기 ----------
+    def _row_height(self) -> int:
+        try:
+            return int(ttk.Style(self).lookup("Treeview", "rowheight")) or 20
+        except (tk.TclError, ValueError):
+            return 20
+
+    def _clamp_top(self):
+        self._top = max(0, min(self._top, self._count - self._visible))
+
+    def _render(self):
+        self._clamp_top()
+        self.tree.delete(*self.tree.get_children())
+        self._shown = []
+        end = min(self._count, self._top + self._visible)
+        for i in range(self._top, end):
+            key, values, tags = self._row_fn(i)
+            key = str(key)
+            self.tree.insert("", "end", iid=key, values=values, tags=tags)
+            self._shown.append(key)
+        visible_sel = [k for k in self._shown if k in self._selected]
+        if visible_sel:
+            self.tree.selection_set(visible_sel)
+
+        if self._count:
+            self.vsb.set(self._top / self._count, end / self._count)
+        else:
+            self.vsb.set(0, 1)
+
+    def _on_resize(self):
+        # 머리글 한 줄을 빼고 들어가는 행 수
+        visible = max(1, self.tree.winfo_height() // self._row_height() - 1)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    # ---------- 스크롤/선택 ----------
+    def _scroll_units(self, n: int):
+        self._top += n
+        self._render()
+        return "break"
+
+    def _on_wheel(self, event):
+        step = -1 if event.delta > 0 else 1
+        return self._scroll_units(step * 3)
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * self._count)
+            self._render()
+        elif args[0] == "scroll":
+            n = int(args[1])
+            self._scroll_units(n * self._visible if args[2] == "pages" else n)
+
+    def _on_key(self, step: int):
+        """방향키가 화면 끝에 닿으면 한 줄 스크롤"""
+        focus = self.tree.focus()
+        if focus not in self._shown:
+            return None
+        pos = self._shown.index(focus) + step
+        if 0 <= pos < len(self._shown):
+            return None  # 화면 안 이동은 Treeview 기본 동작
+        self._scroll_units(step)
+        if self._shown:
+            target = self._shown[0 if step < 0 else -1]
+            self.tree.focus(target)
+            self.tree.selection_set(target)
+        return "break"
+
+    def _on_select(self):
+        current = set(self.tree.selection())
+        for key in self._shown:
+            if key in current:
+                self._selected.add(key)
+            else:
+                self._selected.discard(key)
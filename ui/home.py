@@ -4,24 +4,19 @@ from datetime import datetime, timedelta
 
 import matplotlib
 matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-import pandas as pd
-
+from ui.components import chart_fonts
+from ui.components.avatar import HAVE_PIL, avatar_photo
 from ui.components.topbar import TopBar
 from services.auth import get_current_user
 from services import storage, analytics
 
-# (선택) 아바타 표시를 위한 Pillow
-try:
-    from PIL import Image, ImageTk  # type: ignore
-    HAVE_PIL = True
-except Exception:
-    HAVE_PIL = False
-
 
 class HomeFrame(ttk.Frame):
+    TOP_N = 5  # 이번달 차트에 보일 카테고리 수
+
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
@@ -50,7 +45,7 @@ class HomeFrame(ttk.Frame):
         self.card_chart = self._make_card(page, "이번달 카테고리 요약", row=0, col=0, padx=(0, 12), pady=(0, 12))
         self.chart_body = ttk.Frame(self.card_chart["body"])
         self.chart_body.pack(fill="both", expand=True)
-        self._chart_canvas = None  # FigureCanvasTkAgg 참조
+        self._build_month_chart(self.chart_body)
 
         # --- 카드 2: 프로필 카드 (플레이스홀더로 생성 → on_show에서 채움)
         self.card_profile = self._make_card(page, "프로필", row=0, col=1, padx=(12, 0), pady=(0, 12))
@@ -60,7 +55,7 @@ class HomeFrame(ttk.Frame):
         self.card_week = self._make_card(page, "최근 7일 요약", row=1, col=0, padx=(0, 12), pady=(12, 0))
         self.week_body = ttk.Frame(self.card_week["body"])
         self.week_body.pack(fill="both", expand=True)
-        self._week_items = []
+        self._build_week_chips(self.week_body)
 
         # --- 카드 4: 빠른 기록
         self.card_quick = self._make_card(page, "빠른 기록", row=1, col=1, padx=(12, 0), pady=(12, 0))
@@ -73,8 +68,39 @@ class HomeFrame(ttk.Frame):
         # 화면 보여질 때마다 사용자/데이터 갱신
         self.topbar.refresh_user()
         self._update_profile_card()     # ✅ 여기서 실제 사용자 정보를 채움
-        self._render_month_chart()
-        self._render_week_summary()
+        self._refresh_data()
+
+    # -------------------- 데이터 (작업 스레드) --------------------
+    def _refresh_data(self):
+        """차트/7일 요약 데이터는 작업 스레드에서 읽고, 그리는 건 끝난 뒤 메인 스레드에서"""
+        u = get_current_user()
+        if not u:
+            self.app.tasks.cancel("home")
+            self._render_month_chart(None, message="로그인 정보가 없습니다.")
+            self._render_week_summary(None)
+            return
+        month = datetime.now().strftime("%Y-%m")
+        self._render_month_chart(None, message="불러오는 중…")
+        self._render_week_summary(None)
+        self.app.tasks.submit(self._read_home, u.username, month, key="home",
+                              on_done=self._apply_home)
+
+    @staticmethod
+    def _read_home(username: str, month: str):
+        # 작업 스레드: 위젯을 건드리지 않음
+        summary = analytics.user_month_summary(username, month)
+
+        # 최근 7일 날짜별 순증감 {date: net} — 날짜순 원장에서 7일 구간만 잘라 씀
+        today = datetime.today()
+        df = storage.get_backend().slice_dates(username, today - timedelta(days=6), today)
+        daily = analytics.signed_amount(df).groupby(df["date"], sort=False).sum()
+        daily = {ts.date(): net for ts, net in daily.items()}
+        return month, summary, daily
+
+    def _apply_home(self, result):
+        month, summary, daily = result
+        self._render_month_chart(summary, month=month)
+        self._render_week_summary(daily)
 
     # -------------------- 카드 공용 --------------------
     def _make_card(self, parent, title, *, row, col, padx=6, pady=6):
@@ -138,14 +164,12 @@ class HomeFrame(ttk.Frame):
         self.lbl_profile_id.config(text=f"회원 ID : {u.username}")
         self.lbl_profile_join.config(text=f"가입일 : {self._guess_join_date(u.username)}")
 
-        # 아바타 로드
+        # 아바타 (미리 만든 96px 썸네일, 디코딩 결과는 공용 캐시에서)
         if getattr(u, "avatar", None) and HAVE_PIL:
-            try:
-                im = Image.open(u.avatar)
-                im.thumbnail((96, 96))
-                self._avatar_img = ImageTk.PhotoImage(im)
+            self._avatar_img = avatar_photo(u.avatar, 96)
+            if self._avatar_img is not None:
                 self.lbl_avatar.config(image=self._avatar_img, text="")
-            except Exception:
+            else:
                 self.lbl_avatar.config(image="", text="(이미지 오류)")
         else:
             self.lbl_avatar.config(image="", text="(아바타 없음)")
@@ -173,119 +197,115 @@ class HomeFrame(ttk.Frame):
         # 저장 후 상단바/프로필 카드/차트 다시 갱신
         self.topbar.refresh_user()
         self._update_profile_card()
-        self._render_month_chart()
+        self._refresh_data()
 
     # -------------------- 카드 1: 이번달 차트 --------------------
-    def _render_month_chart(self):
-        # 캔버스 초기화
-        if self._chart_canvas is not None:
-            self._chart_canvas.get_tk_widget().destroy()
-            self._chart_canvas = None
-
-        u = get_current_user()
-        if not u:
-            fig, ax = plt.subplots(figsize=(6, 3), dpi=100)
-            ax.text(0.5, 0.5, "로그인 정보가 없습니다.", ha="center", va="center")
-            ax.set_axis_off()
-            fig.tight_layout()
-            self._chart_canvas = FigureCanvasTkAgg(fig, master=self.chart_body)
-            self._chart_canvas.draw()
-            self._chart_canvas.get_tk_widget().pack(fill="both", expand=True)
-            return
-
-        df = storage.read_all(storage.csv_path_for_user(u.username))
-        month = datetime.now().strftime("%Y-%m")
-        summary = analytics.month_summary(df, month)
-
-        fig, ax = plt.subplots(figsize=(6, 3), dpi=100)
-        if summary.empty:
-            ax.text(0.5, 0.5, f"{month} 데이터가 없습니다.", ha="center", va="center")
-            ax.set_axis_off()
-        else:
-            # Top5 카테고리만 (수입+지출 절대값 기준)
-            summary = summary.copy()
-            summary["총액절대"] = (summary["수입"].abs() + summary["지출"].abs())
-            summary = summary.sort_values("총액절대", ascending=False).head(5)
-            x = range(len(summary))
-            ax.bar(x, summary["수입"], label="수입", linewidth=0)
-            ax.bar(x, -summary["지출"], label="지출", linewidth=0)
-            ax.set_xticks(list(x))
-            ax.set_xticklabels(summary["category"], rotation=0)
-            ax.legend(loc="upper right")
-            ax.set_ylabel("금액")
-            ax.set_title(f"{month} Top 5 카테고리")
-
-        fig.tight_layout()
-        self._chart_canvas = FigureCanvasTkAgg(fig, master=self.chart_body)
-        self._chart_canvas.draw()
+    def _build_month_chart(self, parent):
+        """
+        Figure/캔버스는 한 번만 만들고, 새로고침 때는 막대 높이/라벨만 바꿔서 draw_idle
+        - pyplot 을 거치지 않으므로 figure 관리자에 쌓이는 창이 없음
+        """
+        chart_fonts.setup()  # 제목/범례 글자는 만들 때의 폰트를 계속 쓰므로 Figure 보다 먼저
+        self._fig = Figure(figsize=(6, 3), dpi=100, layout="tight")
+        ax = self._ax = self._fig.add_subplot()
+        slots = range(self.TOP_N)
+        self._bars_inc = ax.bar(slots, [0] * self.TOP_N, label="수입", linewidth=0)
+        self._bars_exp = ax.bar(slots, [0] * self.TOP_N, label="지출", linewidth=0)
+        ax.legend(loc="upper right")
+        ax.set_ylabel("금액")
+        self._chart_msg = self._fig.text(0.5, 0.5, "", ha="center", va="center")
+
+        self._chart_canvas = FigureCanvasTkAgg(self._fig, master=parent)
         self._chart_canvas.get_tk_widget().pack(fill="both", expand=True)
 
-    # -------------------- 카드 3: 최근 7일 요약 --------------------
-    def _render_week_summary(self):
-        # 기존 아이템 제거
-        for w in self._week_items:
-            w.destroy()
-        self._week_items.clear()
+    def _render_month_chart(self, summary, month: str = "", message: str = ""):
+        """summary 가 None 이면 message 만 표시 (로그인 전/불러오는 중)"""
+        ax = self._ax
+        if summary is not None and summary.empty:
+            summary, message = None, f"{month} 데이터가 없습니다."
 
-        u = get_current_user()
-        if not u:
+        if summary is None:
+            ax.set_visible(False)
+            self._chart_msg.set_text(message)
+            self._chart_canvas.draw_idle()
             return
 
-        df = storage.read_all(storage.csv_path_for_user(u.username))
-        if df.empty or "date" not in df.columns:
-            dates = [datetime.today() - timedelta(days=i) for i in range(6, -1, -1)]
-            self._draw_week_chips(dates, {})
-            return
-
-        # 최근 7일 날짜 리스트 (과거->오늘 순)
-        dates = [datetime.today() - timedelta(days=i) for i in range(6, -1, -1)]
-
-        # 날짜별 순증감 계산
-        df2 = df.copy()
-        df2["amount"] = pd.to_numeric(df2["amount"], errors="coerce").fillna(0).astype(int)
-        df2["signed"] = df2.apply(lambda r: r["amount"] if r["type"] == "수입" else -r["amount"], axis=1)
-        daily = df2.groupby("date")["signed"].sum().to_dict()  # {'YYYY-MM-DD': net}
-
-        self._draw_week_chips(dates, daily)
-
-    def _draw_week_chips(self, dates, daily_map):
-        wrap = self.card_week["body"]
-
-        # 이전 내용 비우기
-        for child in wrap.winfo_children():
-            child.destroy()
+        # Top5 카테고리만 (수입+지출 절대값 기준)
+        summary = summary.copy()
+        summary["총액절대"] = (summary["수입"].abs() + summary["지출"].abs())
+        summary = summary.sort_values("총액절대", ascending=False).head(self.TOP_N)
+        inc = summary["수입"].tolist()
+        exp = summary["지출"].tolist()
+        n = len(summary)
+
+        # 막대 칸은 TOP_N 개 고정: 값이 있는 칸만 높이를 바꾸고 나머지는 숨김
+        for i, (bar_inc, bar_exp) in enumerate(zip(self._bars_inc, self._bars_exp)):
+            bar_inc.set_visible(i < n)
+            bar_exp.set_visible(i < n)
+            if i < n:
+                bar_inc.set_height(inc[i])
+                bar_exp.set_height(-exp[i])
+
+        ax.set_xlim(-0.5, max(n, 1) - 0.5)
+        top, bottom = max(inc + [0]), -max(exp + [0])
+        pad = (top - bottom) * 0.05 or 1
+        ax.set_ylim(bottom - pad, top + pad)
+        ax.set_xticks(range(n))
+        ax.set_xticklabels(summary["category"], rotation=0)
+        ax.set_title(f"{month} Top {self.TOP_N} 카테고리")
+
+        self._chart_msg.set_text("")
+        ax.set_visible(True)
+        self._chart_canvas.draw_idle()
 
+    # -------------------- 카드 3: 최근 7일 요약 --------------------
+    def _build_week_chips(self, wrap):
+        """요일 칩 7개는 한 번만 만들고, 새로고침 때는 글자만 바꿈"""
         legend = ttk.Label(wrap, text="· 값은 (수입-지출) 순증감입니다. 음수면 지출이 더 큼", foreground="#6b7280")
         legend.pack(anchor="w", pady=(0, 8))
 
         grid = ttk.Frame(wrap)
         grid.pack()
 
-        for i, d in enumerate(dates):
+        self._week_items = []
+        for i in range(7):
             # 칩 프레임
             chip = tk.Frame(
                 grid, bg="white",
                 highlightthickness=1, highlightbackground="#e5e7eb"
             )
             chip.grid(row=0, column=i, padx=6, pady=6, sticky="nsew")
-            self._week_items.append(chip)
 
             # 상단: 요일/일자
-            ttk.Label(chip, text=d.strftime("%a"), foreground="#6b7280").pack(pady=(10, 2))
+            weekday = ttk.Label(chip, text="", foreground="#6b7280")
+            weekday.pack(pady=(10, 2))
             circle = tk.Canvas(chip, width=64, height=64, highlightthickness=0, bg="white")
             circle.pack()
             circle.create_oval(6, 6, 58, 58, outline="#c7d2fe", width=2)
-            circle.create_text(32, 32, text=d.strftime("%d"), fill="#374151")
+            day = circle.create_text(32, 32, text="", fill="#374151")
 
             # 값
-            net = int(daily_map.get(d.strftime("%Y-%m-%d"), 0))
-            val = f"{net:+,}"
-            ttk.Label(chip, text=val, font=("Malgun Gothic", 10, "bold")).pack(pady=(6, 10))
+            value = ttk.Label(chip, text="…", font=("Malgun Gothic", 10, "bold"))
+            value.pack(pady=(6, 10))
+            self._week_items.append((weekday, circle, day, value))
 
         # 그리드 늘어나게
-        for i in range(len(dates)):
+        for i in range(7):
             grid.grid_columnconfigure(i, weight=1)
 
+    def _render_week_summary(self, daily_map):
+        """daily_map 이 None 이면 값 자리에 '…' 표시 (불러오는 중)"""
+        # 최근 7일 날짜 리스트 (과거->오늘 순)
+        dates = [datetime.today() - timedelta(days=i) for i in range(6, -1, -1)]
+        for d, (weekday, circle, day, value) in zip(dates, self._week_items):
+            weekday.config(text=d.strftime("%a"))
+            circle.itemconfigure(day, text=d.strftime("%d"))
+            if daily_map is None:
+                value.config(text="…")
+            else:
+                net = int(daily_map.get(d.date(), 0))
+                value.config(text=f"{net:+,}")
+
     # -------------------- 카드 4: 빠른 기록 --------------------
     def _build_quick_entry(self, parent):
         row = ttk.Frame(parent)
@@ -322,7 +342,6 @@ class HomeFrame(ttk.Frame):
             messagebox.showwarning("로그인", "로그인 후 이용해주세요.")
             return
 
-        path = storage.csv_path_for_user(u.username)
         row = {
             "date": datetime.now().strftime("%Y-%m-%d"),
             "type": typ,
@@ -330,7 +349,6 @@ class HomeFrame(ttk.Frame):
             "description": desc,
             "amount": amt,
         }
-        storage.append_row(row, path)
+        storage.get_backend().append_row(u.username, row)
         messagebox.showinfo("저장", "빠른 기록이 저장되었습니다.")
-        self._render_month_chart()
-        self._render_week_summary()
+        self._refresh_data()
@@ -14,7 +14,13 @@ class LoginFrame(ttk.Frame):
         # ===== 배경(그라데이션) 캔버스 =====
         self.canvas = tk.Canvas(self, highlightthickness=0, bd=0)
         self.canvas.pack(fill="both", expand=True)
-        self.canvas.bind("<Configure>", self._redraw)
+        self.canvas.bind("<Configure>", self._on_configure)
+        self._redraw_job = None      # 예약된 다시 그리기 (after id)
+        self._drawn_size = None      # 마지막으로 그린 캔버스 크기
+        self._grad_img = None
+        self._grad_id = None         # 배경 이미지 아이템
+        self._card_id = None         # 카드 폴리곤 아이템
+        self._card_size = self._card_pos = None
 
         # 카드 기본 값 (버튼이 안 잘리도록 높이 넉넉하게)
         self.card_w, self.card_h = 560, 520
@@ -41,31 +47,51 @@ class LoginFrame(ttk.Frame):
 
     # ------------------ 배경/카드 그리기 ------------------
     def _draw_gradient(self, w, h, c1="#cc8e96", c2="#8b7bb1"):
-        """세로 그라데이션"""
-        self.canvas.delete("grad")
-        steps = max(h, 1)
+        """
+        세로 그라데이션을 PhotoImage 한 장으로 그림 (캔버스 아이템 1개)
+        - 한 열(h 픽셀)의 색만 계산하고 put(to=...) 으로 가로 w 만큼 타일링
+        """
         r1, g1, b1 = self.winfo_rgb(c1)
         r2, g2, b2 = self.winfo_rgb(c2)
+        steps = max(h, 1)
+        column = []
         for i in range(steps):
             r = int(r1 + (r2 - r1) * i / steps)
             g = int(g1 + (g2 - g1) * i / steps)
             b = int(b1 + (b2 - b1) * i / steps)
-            color = f"#{r//256:02x}{g//256:02x}{b//256:02x}"
-            self.canvas.create_line(0, i, w, i, fill=color, tags="grad")
+            column.append(f"{{#{r//256:02x}{g//256:02x}{b//256:02x}}}")
+
+        img = tk.PhotoImage(width=w, height=h)
+        img.put(" ".join(column), to=(0, 0, w, h))
+        self._grad_img = img  # 참조 유지 (가비지 컬렉션 방지)
+        if self._grad_id is None:
+            self._grad_id = self.canvas.create_image(0, 0, image=img, anchor="nw")
+            self.canvas.tag_lower(self._grad_id)
+        else:
+            self.canvas.itemconfig(self._grad_id, image=img)
 
-    def _round_rect(self, x1, y1, x2, y2, r, **kw):
-        """라운드 카드(폴리곤)"""
-        points = [
+    def _round_rect_points(self, x1, y1, x2, y2, r):
+        """라운드 카드(폴리곤) 꼭짓점"""
+        return [
             x1+r, y1, x2-r, y1, x2, y1, x2, y1+r,
             x2, y2-r, x2, y2, x2-r, y2, x1+r, y2,
             x1, y2, x1, y2-r, x1, y1+r, x1, y1
         ]
-        return self.canvas.create_polygon(points, smooth=True, splinesteps=36, **kw)
 
-    def _redraw(self, _event=None):
-        # 배경
+    def _on_configure(self, _event=None):
+        # 창 크기 조절 중 연속으로 오는 <Configure> 는 한 프레임(약 16ms)에 한 번만 반영
+        if self._redraw_job is None:
+            self._redraw_job = self.after(16, self._redraw)
+
+    def _redraw(self):
+        self._redraw_job = None
         w = max(self.winfo_width(), 1)
         h = max(self.winfo_height(), 1)
+        if (w, h) == self._drawn_size:
+            return
+        self._drawn_size = (w, h)
+
+        # 배경 (크기가 바뀔 때만)
         self._draw_gradient(w, h)
 
         # 화면 크기에 맞춰 카드 크기 살짝 적응
@@ -79,10 +105,18 @@ class LoginFrame(ttk.Frame):
         x2 = cx + cw // 2
         y2 = cy + ch // 2
 
-        # 카드 다시 그림
-        self.canvas.delete("card")
-        self._round_rect(x1, y1, x2, y2, self.card_radius,
-                         fill=self.card_fill, outline=self.card_outline, width=2, tags="card")
+        # 카드: 크기가 같으면 옮기기만, 바뀌었을 때만 꼭짓점 다시 계산
+        if self._card_id is None:
+            self._card_id = self.canvas.create_polygon(
+                self._round_rect_points(x1, y1, x2, y2, self.card_radius), smooth=True, splinesteps=36,
+                fill=self.card_fill, outline=self.card_outline, width=2)
+            self.canvas.tag_raise(self.form_id)
+        elif (cw, ch) == self._card_size:
+            px, py = self._card_pos
+            self.canvas.move(self._card_id, x1 - px, y1 - py)
+        else:
+            self.canvas.coords(self._card_id, self._round_rect_points(x1, y1, x2, y2, self.card_radius))
+        self._card_size, self._card_pos = (cw, ch), (x1, y1)
 
         # 폼 프레임 위치/크기
         self.canvas.coords(self.form_id, cx, cy)
@@ -113,10 +147,11 @@ class LoginFrame(ttk.Frame):
         self.l_id, _ = self._row_entry(root, "ID")
         self.l_pw, self.l_pw_show = self._row_entry(root, "Password", is_password=True)
 
-        tk.Button(root, text="Login", command=self._login,
-                  bg="#f6b981", activebackground="#f0a960",
-                  fg="black", relief="flat", height=2, width=24,
-                  cursor="hand2").pack(pady=(16, 6))
+        self.btn_login = tk.Button(root, text="Login", command=self._login,
+                                   bg="#f6b981", activebackground="#f0a960",
+                                   fg="black", relief="flat", height=2, width=24,
+                                   cursor="hand2")
+        self.btn_login.pack(pady=(16, 6))
 
         # 링크: 회원가입
         wrap = tk.Frame(root, bg=self.card_fill)
@@ -145,10 +180,11 @@ class LoginFrame(ttk.Frame):
         self.s_pw, self.s_pw_show = self._row_entry(root, "Password", is_password=True)
         self.s_pw2, self.s_pw2_show = self._row_entry(root, "Confirm Password", is_password=True)
 
-        tk.Button(root, text="Sign Up", command=self._signup,
-                  bg="#f6b981", activebackground="#f0a960",
-                  fg="black", relief="flat", height=2, width=24,
-                  cursor="hand2").pack(pady=(16, 6))
+        self.btn_signup = tk.Button(root, text="Sign Up", command=self._signup,
+                                    bg="#f6b981", activebackground="#f0a960",
+                                    fg="black", relief="flat", height=2, width=24,
+                                    cursor="hand2")
+        self.btn_signup.pack(pady=(16, 6))
 
         wrap = tk.Frame(root, bg=self.card_fill)
         wrap.pack(pady=(8, 0))
@@ -183,7 +219,15 @@ class LoginFrame(ttk.Frame):
         if not uid or not pw:
             messagebox.showwarning("입력", "ID와 비밀번호를 입력해주세요.")
             return
-        u = auth.login(uid, pw)
+        if self._busy(self.btn_login):
+            return
+        # 비밀번호 해시 확인은 일부러 느리므로 작업 스레드에서 (버튼에 진행 표시)
+        self._set_busy(self.btn_login, "확인 중…")
+        self.app.tasks.submit(auth.login, uid, pw, key="login",
+                              on_done=self._login_done, on_error=self._auth_failed)
+
+    def _login_done(self, u):
+        self._set_busy(self.btn_login, None)
         if not u:
             messagebox.showerror("로그인 실패", "ID 또는 비밀번호가 올바르지 않습니다.")
             return
@@ -202,13 +246,38 @@ class LoginFrame(ttk.Frame):
         if pw != pw2:
             messagebox.showwarning("입력", "비밀번호가 일치하지 않습니다.")
             return
-        ok = auth.register(uid, pw, nick)
+        if self._busy(self.btn_signup):
+            return
+        self._set_busy(self.btn_signup, "가입 중…")
+        self.app.tasks.submit(auth.register, uid, pw, nick, key="signup",
+                              on_done=self._signup_done, on_error=self._auth_failed)
+
+    def _signup_done(self, ok):
+        self._set_busy(self.btn_signup, None)
         if not ok:
             messagebox.showerror("실패", "이미 사용 중인 ID입니다.")
             return
         messagebox.showinfo("완료", "회원가입이 완료되었습니다. 로그인 해주세요.")
         self._show("login")
 
+    def _auth_failed(self, e: BaseException):
+        self._set_busy(self.btn_login, None)
+        self._set_busy(self.btn_signup, None)
+        messagebox.showerror("오류", f"처리 중 오류가 발생했습니다: {e}")
+
+    # ------------------ 진행 표시 ------------------
+    @staticmethod
+    def _busy(btn) -> bool:
+        return str(btn.cget("state")) == "disabled"
+
+    def _set_busy(self, btn, text):
+        """text 가 있으면 버튼을 잠그고 진행 문구 표시, None 이면 원래대로"""
+        if text is not None:
+            btn._idle_text = btn.cget("text")
+            btn.config(text=text, state="disabled", cursor="watch")
+        elif self._busy(btn):
+            btn.config(text=btn._idle_text, state="normal", cursor="hand2")
+
     # ------------------ 유틸 ------------------
     def _placeholder(self, entry: ttk.Entry, text: str, *, is_password=False):
         """엔트리에 플레이스홀더 적용"""
@@ -1,9 +1,6 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
-import matplotlib
-matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
 
 # tkcalendar (없으면 자동 폴백)
 try:
@@ -18,9 +15,11 @@ from app.config import (
     COLOR_INC, COLOR_EXP, COLOR_STRIPE
 )
 from models.transaction import Transaction
-from services import analytics, storage
+from models.transaction_store import TransactionStore
+from services import storage
 from services.auth import get_current_user
 from ui.components.topbar import TopBar
+from ui.components.virtual_table import VirtualTable
 
 
 def _comma(n: int) -> str:
@@ -38,6 +37,10 @@ class AccountBookPage(ttk.Frame):
         content = ttk.Frame(self, style="Page.TFrame")
         content.pack(fill="both", expand=True)
 
+        self._shown_errors = []  # 이미 안내한 CSV 오류 목록
+        self._data = None        # 표에 보이는 거래 (TransactionStore, 날짜순)
+        self._inc = self._exp = 0  # 합계 라벨 값 (추가/삭제 때 변경분만 반영)
+
         self._build_toolbar(content)
         self._build_table(content)
         self._build_bottom(content)
@@ -125,33 +128,31 @@ class AccountBookPage(ttk.Frame):
 
         ttk.Button(panel, text="월별 그래프", command=self._on_chart)\
             .grid(row=1, column=col_for_chart, padx=(0, 0))
+        ttk.Button(panel, text="CSV 가져오기", command=self._on_import)\
+            .grid(row=1, column=col_for_chart + 1, padx=(6, 0))
 
-        # 열 간격: 최대 0~10까지
-        for c in range(11):
+        # 열 간격: 최대 0~11까지
+        for c in range(12):
             panel.grid_columnconfigure(c, pad=2)
 
     def _build_table(self, parent):
         body = ttk.Frame(parent)
         body.pack(fill="both", expand=True, pady=(10, 0))
 
-        cols = ("date", "type", "category", "description", "amount")
-        self.tree = ttk.Treeview(body, columns=cols, show="headings", height=18)
-        headings = ["날짜", "구분", "카테고리", "설명", "금액"]
-        widths = [110, 70, 140, 520, 110]
-        anchors = ["center", "center", "center", "w", "e"]
-
-        for c, label, w, a in zip(cols, headings, widths, anchors):
-            self.tree.heading(c, text=label)
-            self.tree.column(c, width=w, anchor=a, stretch=(c == "description"))
-
-        vsb = ttk.Scrollbar(body, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscroll=vsb.set)
-        self.tree.pack(side="left", fill="both", expand=True)
-        vsb.pack(side="right", fill="y")
+        # 보이는 행만 만드는 표 (수십만 건도 화면 한 장 분량만 그림)
+        self.table = VirtualTable(
+            body,
+            columns=("date", "type", "category", "description", "amount", "balance"),
+            headings=["날짜", "구분", "카테고리", "설명", "금액", "잔액"],
+            widths=[110, 70, 140, 520, 110, 120],
+            anchors=["center", "center", "center", "w", "e", "e"],
+            stretch="description",
+        )
+        self.table.pack(fill="both", expand=True)
 
-        self.tree.tag_configure("odd", background=COLOR_STRIPE)
-        self.tree.tag_configure("inc", foreground=COLOR_INC)
-        self.tree.tag_configure("exp", foreground=COLOR_EXP)
+        self.table.tag_configure("odd", background=COLOR_STRIPE)
+        self.table.tag_configure("inc", foreground=COLOR_INC)
+        self.table.tag_configure("exp", foreground=COLOR_EXP)
 
     def _build_bottom(self, parent):
         bottom = tk.Frame(parent, bg=COLOR_BG)
@@ -161,39 +162,61 @@ class AccountBookPage(ttk.Frame):
 
     # ---------- 동작 ----------
     @property
-    def _csv_path(self):
-        from services.storage import csv_path_for_user
-        u = get_current_user()
-        return csv_path_for_user(u.username)
+    def _username(self):
+        return get_current_user().username
 
     def _load_data(self):
-        try:
-            df = storage.read_all(self._csv_path)
-        except Exception as e:
-            messagebox.showerror("오류", f"CSV 읽기 실패: {e}")
+        """거래 읽기와 표 배열 만들기는 작업 스레드에서, 표 반영은 끝난 뒤 메인 스레드에서"""
+        self._data = None
+        self.table.set_source(0, self._row)
+        self.lbl_summary.config(text="불러오는 중…")
+        self.app.tasks.submit(self._read_table, self._username, key="account",
+                              on_done=self._apply_table, on_error=self._load_failed)
+
+    @staticmethod
+    def _read_table(username: str):
+        # 작업 스레드: 위젯을 건드리지 않음
+        backend = storage.get_backend()
+        data = TransactionStore.from_frame(backend.read_all(username))
+        return data, backend.load_errors(username)
+
+    def _apply_table(self, result):
+        data, errors = result
+        self._warn_load_errors(errors)
+
+        # 표에는 행 수와 행 함수만 넘김 (보이는 행만 그때그때 문자열로 만듦)
+        self._data = data
+        self.table.set_source(len(self._data), self._row)
+
+        self._inc, self._exp = self._data.totals()
+        self._update_summary()
+
+    def _load_failed(self, e: BaseException):
+        self.lbl_summary.config(text="합계: -")
+        messagebox.showerror("오류", f"CSV 읽기 실패: {e}")
+
+    def _update_summary(self):
+        total = self._inc - self._exp
+        self.lbl_summary.config(
+            text=f"합계: {_comma(total)}원 (수입 {_comma(self._inc)}원 / 지출 {_comma(self._exp)}원)")
+
+    def _row(self, i: int):
+        """i번째 거래 -> (거래 id, 표시 값, 태그)"""
+        row = self._data[i]
+        typ = row.type
+        tags = ("odd",) if i % 2 else ()
+        tags += ("inc",) if typ == "수입" else ("exp",)
+        values = (row.date, typ, row.category, row.description, _comma(row.amount), _comma(row.balance))
+        return row.id, values, tags
+
+    def _warn_load_errors(self, errors):
+        """CSV에서 읽지 못한 행이 있으면 한 번 알려줌 (같은 내용은 반복하지 않음)"""
+        if not errors or errors == self._shown_errors:
             return
-
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        inc = exp = 0
-        for idx, row in df.iterrows():
-            amt = int(row["amount"]) if str(row["amount"]).strip() else 0
-            tags = []
-            tags.append("odd" if idx % 2 else "")
-            if row["type"] == "수입":
-                tags.append("inc"); inc += amt
-            else:
-                tags.append("exp"); exp += amt
-
-            self.tree.insert(
-                "", "end",
-                values=(row["date"], row["type"], row["category"], row["description"], _comma(amt)),
-                tags=tuple(t for t in tags if t)
-            )
-
-        total = inc - exp
-        self.lbl_summary.config(text=f"합계: {_comma(total)}원 (수입 {_comma(inc)}원 / 지출 {_comma(exp)}원)")
+        self._shown_errors = errors
+        lines = "\n".join(errors[:10])
+        more = f"\n... 외 {len(errors) - 10}건" if len(errors) > 10 else ""
+        messagebox.showwarning("CSV 확인", f"형식이 잘못되어 제외된 행이 있습니다.\n\n{lines}{more}")
 
     def _on_add(self):
         try:
@@ -210,50 +233,56 @@ class AccountBookPage(ttk.Frame):
             messagebox.showwarning("입력 오류", f"잘못된 값: {e}")
             return
 
-        storage.append_row(tx.__dict__, self._csv_path)
-        self._load_data()
+        storage.get_backend().append_row(self._username, tx.__dict__)
+
+        # 전체를 다시 읽지 않고 새 거래 한 건만 날짜 위치에 끼워 넣음
+        if self._data is None:
+            self._load_data()
+        else:
+            pos = self._data.append(tx)
+            if tx.type == "수입":
+                self._inc += tx.amount
+            else:
+                self._exp += tx.amount
+            self.table.set_source(len(self._data), self._row, keep_position=True)
+            self.table.see(pos)
+            self._update_summary()
         self.ent_desc.delete(0, "end")
         self.ent_amt.delete(0, "end")
 
     def _on_delete(self):
-        sel = self.tree.selection()
+        sel = self.table.selection()
+        if self._data is None:
+            return  # 아직 불러오는 중
         if not sel:
             messagebox.showinfo("안내", "삭제할 항목을 선택하세요.")
             return
 
-        all_items = list(self.tree.get_children())
-        keep_values = []
-        for item in all_items:
-            if item in sel:
-                continue
-            vals = list(self.tree.item(item)["values"])
-            vals[4] = int(str(vals[4]).replace(",", ""))
-            keep_values.append(vals)
-
-        import pandas as pd
-        df = pd.DataFrame(keep_values, columns=["date", "type", "category", "description", "amount"])
-        if not df.empty:
-            df["amount"] = df["amount"].astype(int)
-        storage.overwrite(df, self._csv_path)
-        self._load_data()
+        ids = [int(k) for k in sel]
+        storage.get_backend().delete_ids(self._username, ids)
 
-    def _on_chart(self):
-        month = self.ent_month.get().strip()
-        df = storage.read_all(self._csv_path)
-        summary = analytics.month_summary(df, month)
-        if summary.empty:
-            messagebox.showinfo("안내", f"{month} 데이터가 없습니다.")
+        # 지운 행만 빼고 합계는 빠진 만큼만 조정
+        inc, exp = self._data.delete(ids).totals()
+        self._inc -= inc
+        self._exp -= exp
+        self.table.clear_selection()
+        self.table.set_source(len(self._data), self._row, keep_position=True)
+        self._update_summary()
+
+    def _on_import(self):
+        """은행/카드 명세서 CSV 를 열 대응을 골라 한 번에 가져옴"""
+        from ui.pages.import_dialog import ImportDialog
+
+        path = filedialog.askopenfilename(
+            title="가져올 CSV 선택", filetypes=[("CSV 파일", "*.csv"), ("모든 파일", "*.*")])
+        if not path:
             return
+        ImportDialog(self, self.app, self._username, path, on_done=lambda result: self._load_data())
 
-        plt.figure()
-        plt.title(f"{month} 카테고리별 수입/지출")
-        x = range(len(summary))
-        plt.bar(x, summary["수입"], label="수입", linewidth=0)
-        plt.bar(x, -summary["지출"], label="지출", linewidth=0)
-        plt.xticks(x, summary["category"], rotation=30)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+    def _on_chart(self):
+        """월별 그래프는 분석 화면의 그래프 영역에서 표시 (팝업 창을 따로 띄우지 않음)"""
+        self.app.page("analytics").open_month(self.ent_month.get().strip(), "bar")
+        self.app.show("analytics")
 
     # ---------- 달력 유틸 ----------
     def _sync_month_from_date(self):
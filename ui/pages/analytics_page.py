@@ -1,35 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import matplotlib
 matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
-import matplotlib as mpl
 import matplotlib.dates as mdates
 import pandas as pd  # 날짜 인덱스 변환용
 
-# ✅ 한글/숫자 깨짐 방지: OS별 폰트 지정
-try:
-    plt.rcParams["font.family"] = "Malgun Gothic"   # Windows
-except Exception:
-    for cand in ["AppleGothic", "NanumGothic", "DejaVu Sans"]:
-        try:
-            plt.rcParams["font.family"] = cand
-            break
-        except Exception:
-            pass
-mpl.rcParams["axes.unicode_minus"] = False
-
 # tkcalendar (없으면 자동 폴백)
 try:
-    from tkcalendar import Calendar
+    from tkcalendar import Calendar, DateEntry
     HAVE_TKCALENDAR = True
 except Exception:
     HAVE_TKCALENDAR = False
 
-from services import storage, analytics
+from services import analytics
 from services.auth import get_current_user
-from app.config import COLOR_BORDER, COLOR_PANEL
+from app.config import COLOR_BORDER, COLOR_PANEL, DATE_FMT
+from ui.components.chart_panel import ChartPanel
 from ui.components.topbar import TopBar
 
 
@@ -64,33 +51,119 @@ class AnalyticsPage(ttk.Frame):
                 .grid(row=0, column=2, padx=4)
             btn_col_start = 3
 
-        ttk.Button(panel, text="카테고리 막대", command=self._bar)\
+        ttk.Button(panel, text="카테고리 막대", command=lambda: self._show("bar"))\
             .grid(row=0, column=btn_col_start + 0, padx=4)
-        ttk.Button(panel, text="일자 순증감", command=self._line)\
+        ttk.Button(panel, text="일자 순증감", command=lambda: self._show("line"))\
             .grid(row=0, column=btn_col_start + 1, padx=4)
-        ttk.Button(panel, text="수입/지출 파이", command=self._pie)\
+        ttk.Button(panel, text="수입/지출 파이", command=lambda: self._show("pie"))\
             .grid(row=0, column=btn_col_start + 2, padx=4)
+        # 월을 직접 고치면 월 보기로 돌아감
+        self.ent_month.bind("<Key>", lambda e: self._use_month())
 
-        self.info = ttk.Label(content, text="월을 입력하거나 📅 버튼으로 선택한 뒤, 원하는 그래프 버튼을 클릭하세요.", anchor="w")
+        # 기간(시작~끝) 선택: 연도/최근 12개월/임의 기간
+        ttk.Label(panel, text="기간").grid(row=1, column=0, sticky="e", pady=(6, 0))
+        period = ttk.Frame(panel)
+        period.grid(row=1, column=1, columnspan=btn_col_start + 3, sticky="w", padx=(6, 0), pady=(6, 0))
+        self.ent_from = self._date_entry(period)
+        self.ent_from.pack(side="left")
+        ttk.Label(period, text="~").pack(side="left", padx=4)
+        self.ent_to = self._date_entry(period)
+        self.ent_to.pack(side="left")
+        ttk.Button(period, text="기간 적용", command=self._apply_range).pack(side="left", padx=(8, 4))
+        ttk.Button(period, text="올해", command=self._this_year).pack(side="left", padx=4)
+        ttk.Button(period, text="최근 12개월", command=self._last_12_months).pack(side="left", padx=4)
+
+        self.info = ttk.Label(content, text="월 또는 기간을 고른 뒤, 원하는 그래프 버튼을 클릭하세요.", anchor="w")
         self.info.pack(fill="x", pady=(10, 0))
 
+        # 페이지 안의 그래프 영역 (캔버스 하나를 종류만 바꿔 가며 재사용)
+        self.chart = ChartPanel(content, ("bar", "line", "pie"))
+        self.chart.pack(fill="both", expand=True, pady=(10, 0))
+
+        self._kind = "bar"
+        self._range = None     # (시작, 끝) 날짜 문자열이면 기간 보기, None 이면 월 보기
+        self._period_data = {}  # 기간 키 -> (카테고리 요약, 순증감 시리즈)
+
     def on_show(self):
         self.topbar.refresh_user()
+        # 다른 화면에서 거래가 바뀌었을 수 있으므로 데이터는 들어올 때마다 새로 읽음
+        self._period_data.clear()
+        self._show(self._kind)
+
+    def open_month(self, month: str, kind: str = "bar"):
+        """다른 화면에서 특정 월/그래프로 열 때 (다음 on_show 에서 표시)"""
+        self.ent_month.delete(0, "end")
+        self.ent_month.insert(0, month)
+        self._kind = kind
+        self._use_month()
+
+    @staticmethod
+    def _date_entry(parent):
+        if HAVE_TKCALENDAR:
+            return DateEntry(parent, width=12, date_pattern="yyyy-mm-dd")
+        ent = ttk.Entry(parent, width=12)
+        ent.insert(0, datetime.now().strftime(DATE_FMT))
+        return ent
+
+    @staticmethod
+    def _set_entry(ent, value: str):
+        ent.delete(0, "end")
+        ent.insert(0, value)
 
     @property
-    def _csv_path(self):
-        from services.storage import csv_path_for_user
-        u = get_current_user()
-        return csv_path_for_user(u.username)
-
-    def _get_summary(self):
-        month = self.ent_month.get().strip()
-        if not self._is_valid_month(month):
+    def _username(self):
+        return get_current_user().username
+
+    def _period(self):
+        """지금 보기의 키: ("month", 'YYYY-MM') 또는 ("range", 시작, 끝)"""
+        if self._range is not None:
+            return ("range",) + self._range
+        return ("month", self.ent_month.get().strip())
+
+    def _get_period(self):
+        """_period() 와 같되 월 형식이 틀리면 안내 후 None"""
+        period = self._period()
+        if period[0] == "month" and not self._is_valid_month(period[1]):
             messagebox.showwarning("형식", "월 형식은 YYYY-MM 입니다. 예) 2025-08")
-            return None, None, None
-        df = storage.read_all(self._csv_path)
-        summary = analytics.month_summary(df, month)
-        return month, df, summary
+            return None
+        return period
+
+    @staticmethod
+    def _label(period) -> str:
+        return period[1] if period[0] == "month" else f"{period[1]} ~ {period[2]}"
+
+    # ---------- 기간 선택 ----------
+    def _use_month(self):
+        """월 입력칸 기준 보기로 돌아감"""
+        self._range = None
+
+    def _apply_range(self):
+        try:
+            start = datetime.strptime(self.ent_from.get().strip(), DATE_FMT).date()
+            end = datetime.strptime(self.ent_to.get().strip(), DATE_FMT).date()
+        except ValueError:
+            messagebox.showwarning("형식", "기간 형식은 YYYY-MM-DD 입니다. 예) 2025-01-01")
+            return
+        if start > end:
+            messagebox.showwarning("기간", "시작 날짜가 끝 날짜보다 늦습니다.")
+            return
+        self._show_range(start, end)
+
+    def _this_year(self):
+        today = date.today()
+        self._show_range(date(today.year, 1, 1), date(today.year, 12, 31))
+
+    def _last_12_months(self):
+        """이번 달을 포함한 최근 12개월 (11개월 전 1일 ~ 오늘)"""
+        today = date.today()
+        y, m = divmod(today.year * 12 + today.month - 1 - 11, 12)
+        self._show_range(date(y, m + 1, 1), today)
+
+    def _show_range(self, start: date, end: date):
+        self._set_entry(self.ent_from, start.strftime(DATE_FMT))
+        self._set_entry(self.ent_to, end.strftime(DATE_FMT))
+        self._range = (start.strftime(DATE_FMT), end.strftime(DATE_FMT))
+        self._show(self._kind)
 
     @staticmethod
     def _is_valid_month(s: str) -> bool:
@@ -101,61 +174,86 @@ class AnalyticsPage(ttk.Frame):
             return False
 
     # ---------- 그래프 액션 ----------
-    def _bar(self):
-        month, df, summary = self._get_summary()
-        if month is None:
-            return
-        if summary.empty:
-            messagebox.showinfo("안내", f"{month} 데이터가 없습니다.")
-            return
-        plt.figure()
-        plt.title(f"{month} 카테고리별 수입/지출")
-        x = range(len(summary))
-        plt.bar(x, summary["수입"], label="수입", linewidth=0)
-        plt.bar(x, -summary["지출"], label="지출", linewidth=0)
-        plt.xticks(x, summary["category"], rotation=30)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
-
-    def _line(self):
-        month, df, summary = self._get_summary()
-        if month is None:
+    def _show(self, kind: str):
+        """
+        선택한 월/기간의 kind 그래프 표시.
+        - 데이터는 처음 한 번만 작업 스레드에서 읽고, 종류를 바꿀 때는 다시 그리기만 함
+        """
+        period = self._get_period()
+        if period is None:
             return
-        ser = analytics.daily_net_series(df, month)
-        if ser.size == 0:
-            messagebox.showinfo("안내", f"{month} 데이터가 없습니다.")
+        self._kind = kind
+        data = self._period_data.get(period)
+        if data is not None:
+            self._draw(period, data)
             return
+        self.chart.message("불러오는 중…")
+        self.app.tasks.submit(self._read_period, self._username, period, key="analytics",
+                              on_done=lambda d: self._loaded(period, d))
 
-        # ✅ x축을 날짜로 처리하고 '일(01~31)' 숫자만 보이게 포맷
-        x_dt = pd.to_datetime(ser.index)              # 문자열 → datetime
-        y = ser.values
-
-        fig = plt.figure()
-        plt.title(f"{month} 일자별 순증감(수입-지출)")
-        plt.plot(x_dt, y, marker="o")
+    @staticmethod
+    def _read_period(username: str, period):
+        # 작업 스레드: 위젯을 건드리지 않음
+        if period[0] == "month":
+            month = period[1]
+            return (analytics.user_month_summary(username, month),
+                    analytics.user_daily_net_series(username, month))
+        _, start, end = period
+        # 두 달이 넘는 기간은 선 그래프를 월별 합으로
+        days = (datetime.strptime(end, DATE_FMT) - datetime.strptime(start, DATE_FMT)).days
+        freq = "M" if days > 62 else "D"
+        return (analytics.range_summary(username, start, end),
+                analytics.range_net_series(username, start, end, freq))
 
-        ax = plt.gca()
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%d"))  # 01, 02, ... 형태
-        ax.xaxis.set_major_locator(mdates.DayLocator())           # 일 단위 눈금
-        plt.xticks(rotation=0)                                    # 숫자라 회전 불필요
-        plt.tight_layout()
-        plt.show()
+    def _loaded(self, period, data):
+        self._period_data[period] = data
+        if self._period() == period:
+            self._draw(period, data)
 
-    def _pie(self):
-        month, df, summary = self._get_summary()
-        if month is None:
+    def _draw(self, period, data):
+        label = self._label(period)
+        summary, ser = data
+        if summary.empty or (self._kind == "line" and ser.size == 0):
+            self.chart.message(f"{label} 데이터가 없습니다.")
             return
-        if summary.empty:
-            messagebox.showinfo("안내", f"{month} 데이터가 없습니다.")
+        draw = {"bar": self._bar, "line": self._line, "pie": self._pie}[self._kind]
+        self.chart.show(self._kind, data, lambda ax, d: draw(ax, label, *d))
+
+    @staticmethod
+    def _bar(ax, month, summary, ser):
+        ax.set_title(f"{month} 카테고리별 수입/지출")
+        x = range(len(summary))
+        ax.bar(x, summary["수입"], label="수입", linewidth=0)
+        ax.bar(x, -summary["지출"], label="지출", linewidth=0)
+        ax.set_xticks(list(x))
+        ax.set_xticklabels(summary["category"], rotation=30)
+        ax.legend()
+
+    @staticmethod
+    def _line(ax, month, summary, ser):
+        index = pd.to_datetime(ser.index)
+        if index[-1] - index[0] <= timedelta(days=31):
+            # ✅ x축을 날짜로 처리하고 '일(01~31)' 숫자만 보이게 포맷
+            ax.set_title(f"{month} 일자별 순증감(수입-지출)")
+            ax.plot(index, ser.values, marker="o")
+            ax.xaxis.set_major_formatter(mdates.DateFormatter("%d"))  # 01, 02, ... 형태
+            ax.xaxis.set_major_locator(mdates.DayLocator())           # 일 단위 눈금
             return
+        # 긴 기간: 월별 합 또는 일별 점이 많으므로 눈금은 자동으로
+        monthly = len(index) > 1 and (index.day == 1).all()
+        ax.set_title(f"{month} {'월별' if monthly else '일자별'} 순증감(수입-지출)")
+        ax.plot(index, ser.values, marker="o" if len(index) <= 62 else None)
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+    @staticmethod
+    def _pie(ax, month, summary, ser):
         total_inc = float(summary["수입"].sum())
         total_exp = float(summary["지출"].sum())
-        plt.figure()
-        plt.title(f"{month} 수입/지출 비중")
-        plt.pie([total_inc, total_exp], labels=["수입", "지출"], autopct="%.1f%%", startangle=90)
-        plt.axis("equal")
-        plt.show()
+        ax.set_title(f"{month} 수입/지출 비중")
+        ax.pie([total_inc, total_exp], labels=["수입", "지출"], autopct="%.1f%%", startangle=90)
+        ax.axis("equal")
 
     # ---------- 달력 팝업 ----------
     def _pick_month(self):
@@ -174,6 +272,7 @@ class AnalyticsPage(ttk.Frame):
                 y, m = sel.year, sel.month
                 self.ent_month.delete(0, "end")
                 self.ent_month.insert(0, f"{y:04d}-{m:02d}")
+                self._use_month()
             except Exception:
                 pass
             finally:
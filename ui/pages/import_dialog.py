@@ -0,0 +1,121 @@
+# ui/pages/import_dialog.py
+import tkinter as tk
+from tkinter import ttk, messagebox
+from pathlib import Path
+
+from app.config import CATEGORIES
+from services import importer
+
+_LABELS = {"date": "날짜 *", "type": "구분", "category": "카테고리", "description": "설명", "amount": "금액 *"}
+_NONE = "(없음)"
+
+
+class ImportDialog(tk.Toplevel):
+    """
+    명세서 CSV 가져오기: 열 대응 선택 -> 작업 스레드에서 가져오기 (진행 막대 표시)
+    - 끝나면 on_done(ImportResult) 호출
+    """
+    def __init__(self, parent, app, username: str, path: str, on_done=None):
+        super().__init__(parent)
+        self.title("CSV 가져오기")
+        self.transient(parent.winfo_toplevel())
+        self.grab_set()
+        self.resizable(False, False)
+        self.app = app
+        self._username = username
+        self._path = Path(path)
+        self._on_done = on_done
+
+        try:
+            columns = importer.read_columns(self._path)
+        except Exception as e:
+            messagebox.showerror("오류", f"파일을 읽을 수 없습니다: {e}", parent=self)
+            self.destroy()
+            return
+        guess = importer.guess_mapping(columns)
+
+        root = ttk.Frame(self, padding=16)
+        root.pack(fill="both", expand=True)
+        ttk.Label(root, text=self._path.name, font=("Malgun Gothic", 11, "bold")).pack(anchor="w", pady=(0, 8))
+
+        # 필드별 원본 열 선택
+        grid = ttk.Frame(root)
+        grid.pack(fill="x")
+        self._combos = {}
+        for r, f in enumerate(importer.FIELDS):
+            ttk.Label(grid, text=_LABELS[f], width=12).grid(row=r, column=0, sticky="w", pady=3)
+            cmb = ttk.Combobox(grid, values=[_NONE] + columns, state="readonly", width=28)
+            cmb.set(guess.get(f, _NONE))
+            cmb.grid(row=r, column=1, sticky="ew", pady=3)
+            self._combos[f] = cmb
+
+        row = ttk.Frame(root)
+        row.pack(fill="x", pady=(8, 0))
+        ttk.Label(row, text="기본 카테고리", width=12).pack(side="left")
+        self.cmb_default = ttk.Combobox(row, values=CATEGORIES, state="readonly", width=14)
+        self.cmb_default.set("기타")
+        self.cmb_default.pack(side="left")
+
+        ttk.Label(root, text="* 필수. 구분 열이 없으면 음수 금액을 지출로 봅니다.",
+                  foreground="#6b7280").pack(anchor="w", pady=(8, 0))
+
+        # 진행 표시
+        self.progress = ttk.Progressbar(root, mode="determinate", maximum=1, length=360)
+        self.progress.pack(fill="x", pady=(12, 4))
+        self.lbl_progress = ttk.Label(root, text="")
+        self.lbl_progress.pack(anchor="w")
+
+        btns = ttk.Frame(root)
+        btns.pack(fill="x", pady=(12, 0))
+        self.btn_run = ttk.Button(btns, text="가져오기", command=self._run)
+        self.btn_run.pack(side="right")
+        self.btn_close = ttk.Button(btns, text="닫기", command=self.destroy)
+        self.btn_close.pack(side="right", padx=(0, 6))
+
+    def _mapping(self):
+        return {f: c.get() for f, c in self._combos.items() if c.get() != _NONE}
+
+    def _run(self):
+        mapping = self._mapping()
+        missing = [_LABELS[f].rstrip(" *") for f in importer.REQUIRED if f not in mapping]
+        if missing:
+            messagebox.showwarning("열 선택", f"{', '.join(missing)} 열을 선택하세요.", parent=self)
+            return
+
+        self.btn_run.config(state="disabled")
+        self.btn_close.config(state="disabled")
+        self.protocol("WM_DELETE_WINDOW", lambda: None)  # 끝날 때까지 닫지 않음
+        self.lbl_progress.config(text="읽는 중…")
+
+        # 진행률은 작업 스레드에서 메인 스레드로 넘겨 표시 (작업 스레드에서는 위젯을 건드리지 않음)
+        default_category = self.cmb_default.get()
+        progress = lambda done, total: self.app.tasks.post(self._show_progress, done, total)
+        self.app.tasks.submit(
+            lambda: importer.import_csv(self._username, self._path, mapping,
+                                        default_category=default_category, progress=progress),
+            key="import", on_done=self._finished, on_error=self._failed,
+        )
+
+    def _show_progress(self, done: int, total: int):
+        if not self.winfo_exists():
+            return
+        self.progress.config(maximum=max(total, 1), value=done)
+        self.lbl_progress.config(text=f"{done:,} / {total:,}행 확인")
+
+    def _finished(self, result):
+        self.destroy()
+        msg = f"{result.added:,}건을 가져왔습니다."
+        if result.errors:
+            lines = "\n".join(result.errors[:10])
+            more = f"\n... 외 {len(result.errors) - 10}건" if len(result.errors) > 10 else ""
+            msg += f"\n\n형식이 잘못되어 제외된 행 {len(result.errors):,}건:\n{lines}{more}"
+        messagebox.showinfo("가져오기 완료", msg)
+        if self._on_done is not None:
+            self._on_done(result)
+
+    def _failed(self, e: BaseException):
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+        self.btn_run.config(state="normal")
+        self.btn_close.config(state="normal")
+        self.lbl_progress.config(text="")
+        messagebox.showerror("오류", f"가져오기 실패: {e}", parent=self)
@@ -4,13 +4,7 @@ from tkinter import ttk, filedialog, messagebox
 from services.auth import AuthService, get_current_user, set_current_user
 
 auth = AuthService()
-
-try:
-    # Pillow가 있으면 미리보기 리사이징
-    from PIL import Image, ImageTk  # type: ignore
-    HAVE_PIL = True
-except Exception:
-    HAVE_PIL = False
+from ui.components.avatar import HAVE_PIL, avatar_photo
 
 
 class ProfileDialog(tk.Toplevel):
@@ -96,12 +90,10 @@ class ProfileDialog(tk.Toplevel):
 
     def _load_preview(self, path: str):
         if HAVE_PIL:
-            try:
-                img = Image.open(path)
-                img.thumbnail((120, 120))
-                self._preview_img = ImageTk.PhotoImage(img)
-                self.preview.configure(image=self._preview_img)
-            except Exception:
+            self._preview_img = avatar_photo(path, 120)
+            if self._preview_img is not None:
+                self.preview.configure(image=self._preview_img, text="")
+            else:
                 self.preview.configure(image="", text="(미리보기 실패)")
         else:
             # Pillow 없으면 경로만 표시
@@ -120,8 +112,8 @@ class ProfileDialog(tk.Toplevel):
                 return
 
         avatar_path = self.lbl_avatar_path.cget("text")
-        if avatar_path == "선택된 파일 없음":
-            avatar_path = None
+        if avatar_path in ("선택된 파일 없음", self._user.avatar):
+            avatar_path = None  # 새로 고르지 않았으면 다시 올리지 않음
 
         updated = auth.update_profile(
             self._user.username,